@@ -9,7 +9,7 @@ rm -rf pyperplan-upf && git clone https://github.com/aiplan4eu/pyperplan-upf &&
 pip install -r requirements.txt
 
 echo "GENERATING PYTHON PROTO PARSER"
-python -m grpc_tools.protoc -I=./python/ --python_out=./python --grpc_python_out=./python/  ./python/upf.proto
+python -m grpc_tools.protoc -I=./src/ --python_out=./python/generated --grpc_python_out=./python/generated ./src/upf.proto
 
 echo "GENERATING RUST PROTO PARSER"
 cargo build
\ No newline at end of file
@@ -0,0 +1,109 @@
+# Copyright 2022 Franklin Selva. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import heapq
+import itertools
+import queue
+import threading
+import time
+
+# How often a waiting request checks whether it got cancelled.
+POLL_INTERVAL = 0.05
+
+
+def problem_size(msg):
+    """Cheap estimate of the cost of solving a Problem message
+
+    Counts objects, actions, initial state assignments and goals, without
+    decoding anything.
+    """
+    return (
+        len(msg.objects)
+        + len(msg.actions)
+        + len(msg.initialState)
+        + len(msg.packed_initial_state.fluent_ids)
+        + len(msg.goals)
+    )
+
+
+class AdmissionQueue:
+    """Bounds the requests being served, queueing the others by priority
+
+    At most `max_active` requests are admitted at once, and at most
+    `max_queued` others wait for a slot. Waiting requests are admitted by
+    increasing priority value, and in arrival order for equal priorities.
+    Every second spent waiting lowers the priority value of a request by
+    `aging`, so that requests of high value are eventually admitted too.
+    """
+
+    def __init__(self, max_active=10, max_queued=100, aging=10.0):
+        self.max_active = max_active
+        self.max_queued = max_queued
+        self.aging = aging
+        self.admitted = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.cancellations = 0
+        self._active = 0
+        # Heap of [priority, arrival, admitted] entries. Aging lowers every
+        # waiting priority alike, so entries rather hold the priority plus
+        # `aging` times their time.monotonic() arrival time.
+        self._waiting = []
+        self._arrivals = itertools.count()
+        self._cond = threading.Condition()
+
+    def _leave(self, entry):
+        self._waiting.remove(entry)
+        heapq.heapify(self._waiting)
+
+    def acquire(self, priority=0, deadline=None, cancelled=None):
+        """Waits for a slot, until the time.monotonic() `deadline` if given
+
+        Raises queue.Full if `max_queued` requests are already waiting, and
+        TimeoutError if `deadline` passes, or the threading.Event `cancelled`
+        is set, first.
+        """
+        with self._cond:
+            if self._active < self.max_active and not self._waiting:
+                self._active += 1
+                self.admitted += 1
+                return
+            if len(self._waiting) >= self.max_queued:
+                self.rejected += 1
+                raise queue.Full("%d requests already queued" % len(self._waiting))
+            aged = priority + self.aging * time.monotonic()
+            entry = [aged, next(self._arrivals), False]
+            heapq.heappush(self._waiting, entry)
+            while not entry[2]:
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._leave(entry)
+                        self.timeouts += 1
+                        raise TimeoutError("Timed out waiting for admission")
+                if cancelled is not None:
+                    if cancelled.is_set():
+                        self._leave(entry)
+                        self.cancellations += 1
+                        raise TimeoutError("Cancelled waiting for admission")
+                    remaining = min(remaining or POLL_INTERVAL, POLL_INTERVAL)
+                self._cond.wait(remaining)
+            self.admitted += 1
+
+    def release(self):
+        with self._cond:
+            if self._waiting:
+                # Hand the slot over to the first waiting request.
+                heapq.heappop(self._waiting)[2] = True
+                self._cond.notify_all()
+            else:
+                self._active -= 1
+
+    def queued(self):
+        with self._cond:
+            return len(self._waiting)
+
+    def active(self):
+        with self._cond:
+            return self._active
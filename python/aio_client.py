@@ -0,0 +1,113 @@
+# Copyright 2022 Franklin Selva. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import asyncio
+import functools
+
+import grpc
+
+import generated.upf_pb2_grpc as upf_pb2_grpc
+from from_protobuf import FromProtobufConverter
+from to_protobuf import ToProtobufConverter
+
+
+class AsyncUpfGrpcClient:
+    """asyncio client of a UpfGrpcServer, for many requests in flight at once
+
+    Like UpfGrpcClient, it keeps one channel open, from the first request
+    until `close`. If `executor` is given, problems are encoded and plans
+    decoded in it rather than on the event loop. Decoding creates expressions
+    in the problem environment, so the executor should run one task at a time,
+    e.g. ThreadPoolExecutor(max_workers=1).
+    """
+
+    def __init__(self, host, port, keepalive_ms=60000, executor=None, **encoding):
+        # `encoding` holds the ToProtobufConverter options used for requests.
+        self.host = host
+        self.port = port
+        self.executor = executor
+        self.encoding = encoding
+        self.channel_options = [
+            ("grpc.keepalive_time_ms", keepalive_ms),
+            ("grpc.keepalive_timeout_ms", 20000),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),
+        ]
+        self._channel = None
+        self._stub = None
+
+    @property
+    def stub(self):
+        if self._stub is None:
+            self._channel = grpc.aio.insecure_channel(
+                "%s:%d" % (self.host, self.port), options=self.channel_options
+            )
+            self._stub = upf_pb2_grpc.UpfStub(self._channel)
+        return self._stub
+
+    async def close(self):
+        if self._channel is not None:
+            await self._channel.close()
+        self._channel = None
+        self._stub = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _convert(self, f, *args):
+        if self.executor is None:
+            return f(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(f, *args))
+
+    async def plan(self, problem, timeout=None):
+        """Returns the plan for `problem`, failing after `timeout` seconds
+
+        Raises grpc.RpcError with DEADLINE_EXCEEDED status on timeout.
+        """
+        # Converters keep per-conversion state, so each request gets its own.
+        req = await self._convert(ToProtobufConverter(**self.encoding).convert, problem)
+        answer = await self.stub.plan(req, timeout=timeout)
+        return await self._convert(FromProtobufConverter().convert, answer, problem)
+
+    async def plan_many(
+        self, problems, max_concurrency=16, timeout=None, return_exceptions=False
+    ):
+        """Yields (index, plan) pairs for `problems` as their plans arrive
+
+        At most `max_concurrency` requests are in flight at once, each one
+        failing after `timeout` seconds. If `return_exceptions` is True, the
+        exception of a failed request is yielded in place of its plan;
+        otherwise it is raised and the pending requests are cancelled.
+        """
+        problems = enumerate(problems)
+        pending = {}
+
+        def submit():
+            for i, problem in problems:
+                task = asyncio.ensure_future(self.plan(problem, timeout))
+                pending[task] = i
+                if len(pending) >= max_concurrency:
+                    return
+
+        submit()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    i = pending.pop(task)
+                    if task.exception() is None:
+                        yield i, task.result()
+                    elif return_exceptions:
+                        yield i, task.exception()
+                    else:
+                        raise task.exception()
+                submit()
+        finally:
+            for task in pending:
+                task.cancel()
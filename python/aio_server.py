@@ -0,0 +1,147 @@
+# Copyright 2022 Franklin Selva. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import argparse
+import asyncio
+import os
+import threading
+import time
+from concurrent import futures
+
+import grpc
+
+import generated.upf_pb2 as upf_pb2
+import generated.upf_pb2_grpc as upf_pb2_grpc
+from main import NO_DEADLINE
+from plan_cache import PlanCache
+from problem_cache import ProblemCache, content_hash
+from solver_process import Base, SolverPool
+
+
+class AsyncUpfGrpcServer(upf_pb2_grpc.UpfServicer):
+    """UpfGrpcServer on the asyncio event loop, solving in SolverProcesses
+
+    Requests are handled on the event loop, and each solve waits on a thread
+    for one of `max_workers` solver processes (default: one per core), so
+    solves do not contend for the GIL. As with UpfGrpcServer, a solve whose
+    RPC times out or gets cancelled has its process killed.
+
+    Only `plan`, `registerProblem` and `planDelta` are served, without
+    admission control, request coalescing or metrics.
+    """
+
+    def __init__(
+        self,
+        port,
+        engine="tamer",
+        engine_params={"weight": 0.8},
+        max_workers=None,
+        plan_cache=None,
+    ):
+        self.server = None
+        self.port = port
+        self.engine = engine
+        self.engine_params = engine_params
+        self.max_workers = max_workers or os.cpu_count()
+        self.plans = plan_cache if plan_cache is not None else PlanCache()
+        # Registered problems, serialized: solver processes decode and keep
+        # their own.
+        self.problems = ProblemCache()
+        self.solvers = SolverPool(max_size=self.max_workers)
+        # Threads waiting on the solver processes.
+        self.executor = futures.ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _deadline(self, context):
+        remaining = context.time_remaining()
+        if remaining is None or remaining > NO_DEADLINE:
+            return None
+        return time.monotonic() + remaining
+
+    def _cancellation(self, context):
+        done = threading.Event()
+        context.add_done_callback(lambda _: done.set())
+        return done
+
+    def _run_solver(self, request, deadline, cancelled, base):
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        with self.solvers.planner(timeout) as solver:
+            return solver.solve(
+                self.engine,
+                self.engine_params,
+                request,
+                deadline,
+                cancelled,
+                base=base,
+            )
+
+    async def _cached(self, key, request, context, base=None):
+        answer = self.plans.get(key)
+        if answer is None:
+            loop = asyncio.get_running_loop()
+            try:
+                answer = await loop.run_in_executor(
+                    self.executor,
+                    self._run_solver,
+                    request.SerializeToString(),
+                    self._deadline(context),
+                    self._cancellation(context),
+                    base,
+                )
+            except TimeoutError as e:
+                await context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, str(e))
+            self.plans.put(key, answer)
+        return upf_pb2.Answer.FromString(answer)
+
+    async def plan(self, request, context):
+        return await self._cached(content_hash(request), request, context)
+
+    async def registerProblem(self, request, context):
+        key = content_hash(request)
+        if key not in self.problems:
+            self.problems.put(key, request.SerializeToString())
+        return upf_pb2.ProblemHandle(hash=key)
+
+    async def planDelta(self, request, context):
+        registered = self.problems.get(request.hash)
+        if registered is None:
+            await context.abort(
+                grpc.StatusCode.NOT_FOUND, "Unknown problem: %s" % request.hash
+            )
+        base = Base(request.hash, registered, "ProblemDelta")
+        return await self._cached(content_hash(request), request, context, base)
+
+    async def start(self):
+        # Starts the forkserver of the solver processes before gRPC does.
+        self.solvers.prefill(1)
+        self.server = grpc.aio.server()
+        upf_pb2_grpc.add_UpfServicer_to_server(self, self.server)
+        self.server.add_insecure_port("0.0.0.0:%d" % self.port)
+        await self.server.start()
+
+    async def wait_for_termination(self):
+        try:
+            await self.server.wait_for_termination()
+        finally:
+            self.executor.shutdown(wait=False)
+            self.solvers.close()
+
+
+async def serve(port, workers):
+    server = AsyncUpfGrpcServer(port, max_workers=workers)
+    await server.start()
+    await server.wait_for_termination()
+
+
+def main():
+    """Runs the asyncio planning server"""
+    parser = argparse.ArgumentParser(description="UPF asyncio planning server.")
+    parser.add_argument("--port", type=int, default=2222, help="port")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="solver processes (default: cores)"
+    )
+    args = parser.parse_args()
+    asyncio.run(serve(args.port, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# Copyright 2022 Franklin Selva. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import argparse
+import time
+
+from upf.shortcuts import *
+
+import generated.upf_pb2 as upf_pb2
+from to_protobuf import ToProtobufConverter
+
+
+def _recursive_convert_expression(converter, exp):
+    # Reference encoder, as ToProtobufConverter used to do it: one `convert`
+    # dispatch, one Python frame and one temporary list per node.
+    msg = upf_pb2.Expression(
+        type=exp._content.node_type,
+        args=[_recursive_convert_expression(converter, a) for a in exp._content.args],
+    )
+    converter._encode_payload(exp._content.payload, msg.payload)
+    return msg
+
+
+def _count_nodes(exp):
+    count = 0
+    stack = [exp]
+    while stack:
+        e = stack.pop()
+        count += 1
+        stack.extend(e._content.args)
+    return count
+
+
+def _example_problems():
+    from basic_problems import get_example_problems as basic_examples
+    from problems import get_example_problems as robot_examples
+
+    problems = {}
+    for examples in (basic_examples(), robot_examples()):
+        for name, example in examples.items():
+            problems[name] = example.problem
+    return problems
+
+
+def _example_expressions():
+    expressions = []
+    for p in _example_problems().values():
+        for a in p.actions():
+            expressions.extend(a.preconditions())
+            for e in a.effects():
+                expressions.extend((e.fluent(), e.value(), e.condition()))
+        expressions.extend(p.goals())
+    return expressions
+
+
+def _deep_expression(depth):
+    fluents = [Fluent("f%d" % i) for i in range(depth)]
+    exp = fluents[0]()
+    for i, f in enumerate(fluents[1:]):
+        exp = Or(f, exp) if i % 2 else And(f, exp)
+    return exp
+
+
+def _goal_encoder(converter):
+    # Encodes and serializes each expression as a problem goal, so that too
+    # deep ones go through the problem expression table as they would on the
+    # wire.
+    def encode(e):
+        msg = upf_pb2.Problem()
+        with converter._expression_table(msg.expressions):
+            msg.goals.append(converter.convert(e))
+        return msg.SerializeToString()
+
+    return encode
+
+
+def _measure(encode, expressions, repeat):
+    nodes = sum(_count_nodes(e) for e in expressions) * repeat
+    start = time.perf_counter()
+    try:
+        for _ in range(repeat):
+            for e in expressions:
+                encode(e)
+    except RecursionError:
+        return None
+    elapsed = time.perf_counter() - start
+    return len(expressions) * repeat / elapsed, nodes / elapsed
+
+
+def bench_expressions(repeat, depth):
+    converter = ToProtobufConverter(typed_payloads=True)
+    suites = {
+        "examples": (_example_expressions(), repeat),
+        "deep (depth %d)" % depth: ([_deep_expression(depth)], max(1, repeat // 100)),
+    }
+    encoders = {
+        "recursive": lambda e: _recursive_convert_expression(converter, e),
+        "iterative": _goal_encoder(converter),
+    }
+    for suite, (expressions, n) in suites.items():
+        print("\033[94m" + suite + "\033[0m")
+        for name, encode in encoders.items():
+            r = _measure(encode, expressions, n)
+            if r is None:
+                print("  %-10s RecursionError" % name)
+            else:
+                print("  %-10s %12.0f expressions/s %12.0f nodes/s" % (name, *r))
+
+
+def bench_memo(repeat):
+    converter = ToProtobufConverter(typed_payloads=True, intern_symbols=True)
+    print("\033[94m" + "expression memo" + "\033[0m")
+    for name, p in _example_problems().items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            msg = converter.convert(p)
+        elapsed = (time.perf_counter() - start) / repeat
+        print(
+            "  %-40s %6d hits %6d misses %9.3f ms %8d bytes"
+            % (
+                name,
+                converter.memo_hits,
+                converter.memo_misses,
+                elapsed * 1e3,
+                msg.ByteSize(),
+            )
+        )
+
+
+def _latency(f, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
+
+
+def bench_planner_pool(repeat, engine="tamer", params={"weight": 0.8}):
+    from planner_pool import PlannerPool
+
+    def cold(p):
+        with OneshotPlanner(name=engine, params=params) as planner:
+            planner.solve(p)
+
+    def warm(p):
+        with pool.planner() as planner:
+            planner.solve(p)
+
+    pool = PlannerPool(engine, params, max_size=1)
+    pool.prefill()
+    print("\033[94m" + "planner pool (%s)" % engine + "\033[0m")
+    for name, p in _example_problems().items():
+        for label, solve in (("cold", cold), ("warm", warm)):
+            p50, p99 = _latency(lambda: solve(p), repeat)
+            print(
+                "  %-40s %s p50 %9.3f ms p99 %9.3f ms"
+                % (name, label, p50 * 1e3, p99 * 1e3)
+            )
+    pool.close()
+
+
+def bench_client(repeat, port=2223):
+    import grpc
+
+    import generated.upf_pb2_grpc as upf_pb2_grpc
+    from main import UpfGrpcClient, UpfGrpcServer
+
+    p = next(iter(_example_problems().values()))
+    server = UpfGrpcServer(port)
+    server.start()
+    req = ToProtobufConverter().convert(p)
+
+    def channel_per_request():
+        # UpfGrpcClient used to open a new channel for every request.
+        with grpc.insecure_channel("127.0.0.1:%d" % port) as channel:
+            upf_pb2_grpc.UpfStub(channel).plan(req)
+
+    client = UpfGrpcClient("127.0.0.1", port)
+    # The first request solves the problem, the others hit the plan cache,
+    # leaving mostly the RPC overhead to measure.
+    client.stub.plan(req)
+    print("\033[94m" + "client (%d sequential requests)" % repeat + "\033[0m")
+    for label, f in (
+        ("channel per request", channel_per_request),
+        ("persistent channel", lambda: client.stub.plan(req)),
+    ):
+        start = time.perf_counter()
+        p50, p99 = _latency(f, repeat)
+        elapsed = time.perf_counter() - start
+        print(
+            "  %-20s total %8.3f s p50 %9.3f ms p99 %9.3f ms"
+            % (label, elapsed, p50 * 1e3, p99 * 1e3)
+        )
+    client.close()
+    server.server.stop(None)
+    server.wait_for_termination()
+
+
+SUITES = ("expressions", "memo", "pool", "client")
+
+
+def main():
+    """Benchmarks for the protobuf converters and the planning server"""
+    parser = argparse.ArgumentParser(description="UPF protobuf benchmarks.")
+    parser.add_argument("--repeat", type=int, default=1000, help="repetitions")
+    parser.add_argument("--depth", type=int, default=5000, help="deep formula size")
+    parser.add_argument(
+        "--suite", choices=SUITES, action="append", help="benchmarks to run"
+    )
+    args = parser.parse_args()
+    suites = args.suite or ["expressions", "memo"]
+
+    if "expressions" in suites:
+        bench_expressions(args.repeat, args.depth)
+    if "memo" in suites:
+        bench_memo(max(1, args.repeat // 10))
+    if "pool" in suites:
+        bench_planner_pool(max(1, args.repeat // 100))
+    if "client" in suites:
+        bench_client(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,21 @@
 #
 
 
+# Value arrays of the packed initial state, by value type of the fluent.
+BOOL_VALUE, INT_VALUE, REAL_VALUE, OBJECT_VALUE = range(4)
+
+
+def value_kind(t):
+    if t.is_bool_type():
+        return BOOL_VALUE
+    elif t.is_int_type():
+        return INT_VALUE
+    elif t.is_real_type():
+        return REAL_VALUE
+    else:
+        return OBJECT_VALUE
+
+
 class handles:
     def __init__(self, *what):
         self.what = what
@@ -27,14 +42,35 @@ class handles:
 
 
 class Converter:
-    def __init__(self):
-        self.functions = {}
-        for k in dir(self):
-            v = getattr(self, k)
-            if hasattr(v, "_what"):
-                for x in v._what:
-                    self.functions[x] = v
+    # Handler tables are built once per class, when the class is defined.
+    # `_functions` maps the types declared with `@handles` to their handler,
+    # `_resolved` caches the handler found for each concrete type seen by
+    # `convert` so that the MRO is only walked once per type.
+    _functions = {}
+    _resolved = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        functions = {}
+        for klass in reversed(cls.__mro__):
+            for k, v in vars(klass).items():
+                for x in getattr(v, "_what", ()):
+                    functions[x] = getattr(cls, k)
+        cls._functions = functions
+        cls._resolved = {}
+
+    @classmethod
+    def _resolve(cls, t):
+        for klass in t.__mro__:
+            f = cls._functions.get(klass)
+            if f is not None:
+                cls._resolved[t] = f
+                return f
+        raise KeyError(t)
 
     def convert(self, element, *args):
-        f = self.functions[type(element)]
-        return f(element, *args)
+        t = type(element)
+        f = self._resolved.get(t)
+        if f is None:
+            f = self._resolve(t)
+        return f(self, element, *args)
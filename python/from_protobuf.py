@@ -15,38 +15,143 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from fractions import Fraction
+
 import generated.upf_pb2 as upf_pb2
-from converter import Converter, handles
+from converter import (
+    BOOL_VALUE,
+    INT_VALUE,
+    OBJECT_VALUE,
+    REAL_VALUE,
+    Converter,
+    handles,
+    value_kind,
+)
+import numpy as np
 import upf.model
 import upf.plan
 
 
+def _copy_problem(problem):
+    # Problem.clone() copies every action, while patched problems can share
+    # the fluents, objects and actions of the problem they patch.
+    copy = upf.model.Problem(problem.name, problem.env)
+    defaults = problem.fluents_defaults()
+    for fluent in problem.fluents():
+        copy.add_fluent(fluent, default_initial_value=defaults.get(fluent))
+    for obj in problem.all_objects():
+        copy.add_object(obj)
+    for action in problem.actions():
+        copy.add_action(action)
+    for x, v in problem.explicit_initial_values().items():
+        copy.set_initial_value(x, v)
+    for goal in problem.goals():
+        copy.add_goal(goal)
+    return copy
+
+
+def _object_array(items):
+    a = np.empty(len(items), dtype=object)
+    a[:] = items
+    return a
+
+
+class DecodeContext:
+    """Lookup indexes of the problem being decoded, built once per problem."""
+
+    def __init__(self, problem, symbols=()):
+        self.problem = problem
+        # String table of the message being decoded, if names are interned.
+        self.symbols = list(symbols)
+        self.type_manager = problem.env.type_manager
+        self.expression_manager = problem.env.expression_manager
+        self.types = {}
+        self.fluents = {f.name(): f for f in problem.fluents()}
+        self.objects = {o.name(): o for o in problem.all_objects()}
+        self.actions = {a.name: a for a in problem.actions()}
+
+    def symbol(self, msg):
+        if self.symbols:
+            return self.symbols[msg.symbol_id]
+        return msg.symbol
+
+    def type(self, name):
+        t = self.types.get(name)
+        if t is None:
+            t = self.types[name] = self._parse_type(name)
+        return t
+
+    def _parse_type(self, name):
+        if name == "bool":
+            return self.type_manager.BoolType()
+        elif name == "int":
+            return self.type_manager.IntType()  # TODO: deal with bounds
+        elif name == "float":
+            return self.type_manager.RealType()  # TODO: deal with bounds
+        elif "real" in name:
+            a = float(name.split("[")[1].split(",")[0])
+            b = float(name.split(",")[1].split("]")[0])
+            return self.type_manager.RealType(a, b)  # TODO: deal with bounds
+        else:
+            return self.type_manager.UserType(name)
+
+
+def _real(msg):
+    if msg.HasField("real"):
+        return Fraction(msg.real.numerator, msg.real.denominator)
+    # The shortest repr of a double is the decimal value it was meant for.
+    return Fraction(repr(msg.real_value))
+
+
+_PAYLOAD_DECODERS = {
+    upf_pb2.Payload.NONE: lambda msg, ctx, param_map: None,
+    upf_pb2.Payload.BOOL: lambda msg, ctx, param_map: msg.bool_value,
+    upf_pb2.Payload.INT: lambda msg, ctx, param_map: msg.int_value,
+    upf_pb2.Payload.REAL: lambda msg, ctx, param_map: _real(msg),
+    upf_pb2.Payload.FLUENT: lambda msg, ctx, param_map: ctx.fluents[ctx.symbol(msg)],
+    upf_pb2.Payload.OBJECT: lambda msg, ctx, param_map: ctx.objects[ctx.symbol(msg)],
+    upf_pb2.Payload.PARAMETER: lambda msg, ctx, param_map: param_map[ctx.symbol(msg)],
+    upf_pb2.Payload.STRING: lambda msg, ctx, param_map: ctx.symbol(msg),
+}
+
+
 class FromProtobufConverter(Converter):
+    def __init__(self):
+        # Decoded entries of the expression table of the current scope, so
+        # that each shared FNode is rebuilt only once.
+        self._nodes = []
+
+    def _decode_expressions(self, table, ctx, param_map):
+        outer = self._nodes
+        self._nodes = []
+        for entry in table:
+            self._nodes.append(self.convert(entry, ctx, param_map))
+        return outer
+
     @handles(upf_pb2.Fluent)
-    def _convert_fluent(self, msg, problem):
-        env = problem.env
-        if msg.valueType == "bool":
-            value_type = env.type_manager.BoolType()
-        elif msg.valueType == "int":
-            value_type = env.type_manager.IntType()  # TODO: deal with bounds
-        elif msg.valueType == "float":
-            value_type = env.type_manager.RealType()  # TODO: deal with bounds
-        elif "real" in msg.valueType:
-            a = float(msg.valueType.split("[")[1].split(",")[0])
-            b = float(msg.valueType.split(",")[1].split("]")[0])
-            value_type = env.type_manager.RealType(a, b)  # TODO: deal with bounds
+    def _convert_fluent(self, msg, ctx):
+        names = ctx.symbols
+        if names:
+            name = names[msg.name_id]
+            value_type = ctx.type(names[msg.value_type_id])
+            signature = [names[i] for i in msg.signature_ids]
         else:
-            value_type = env.type_manager.UserType(msg.valueType)
-        sig = []
-        for s_type in msg.signature:
-            sig.append(
-                env.type_manager.UserType(s_type)
-            )  # TODO: Also here, there are the cases in wich s_type is not user-defined in principle...
-        fluent = upf.model.Fluent(msg.name, value_type, sig)
+            name = msg.name
+            value_type = ctx.type(msg.valueType)
+            signature = msg.signature
+        # TODO: Also here, there are the cases in wich s_type is not user-defined in principle...
+        sig = [ctx.type(s_type) for s_type in signature]
+        fluent = upf.model.Fluent(name, value_type, sig)
         return fluent
 
     @handles(upf_pb2.Payload)
-    def _convert_payload(self, msg, problem, param_map):
+    def _convert_payload(self, msg, ctx, param_map):
+        decode = _PAYLOAD_DECODERS.get(msg.kind)
+        if decode is None:
+            return self._convert_untyped_payload(msg, ctx, param_map)
+        return decode(msg, ctx, param_map)
+
+    def _convert_untyped_payload(self, msg, ctx, param_map):
         p_type = msg.type
         p_data = msg.value
         if p_type == "none":
@@ -56,94 +161,228 @@ class FromProtobufConverter(Converter):
         elif p_type == "int":
             return int(p_data)
         elif p_type == "real":
-            return float(p_data)
+            return Fraction(p_data)
         elif "real" in p_type:
-            return float(p_data)
+            return Fraction(p_data)
         elif p_type == "fluent":
-            return problem.fluent(p_data)
+            return ctx.fluents[p_data]
         elif p_type == "obj":
-            return problem.object(p_data)
+            return ctx.objects[p_data]
         elif p_type == "aparam":
             return param_map[p_data]
         else:
             return p_data
 
     @handles(upf_pb2.Object)
-    def _convert_object(self, msg, problem):
-        obj = upf.model.Object(msg.name, problem.env.type_manager.UserType(msg.type))
+    def _convert_object(self, msg, ctx):
+        names = ctx.symbols
+        if names:
+            obj = upf.model.Object(names[msg.name_id], ctx.type(names[msg.type_id]))
+        else:
+            obj = upf.model.Object(msg.name, ctx.type(msg.type))
         return obj
 
     @handles(upf_pb2.Expression)
-    def _convert_expression(self, msg, problem, param_map):
-        exp_type = msg.type
-        args = []
-        for arg_msg in msg.args:
-            args.append(self.convert(arg_msg, problem, param_map))
-        payload = self.convert(msg.payload, problem, param_map)
-        return problem.env.expression_manager.create_node(
-            exp_type, tuple(args), payload
-        )
+    def _convert_expression(self, msg, ctx, param_map):
+        # Decoded with an explicit work stack, as they are encoded, so that
+        # deep formulas cannot hit the recursion limit. Arguments are pushed
+        # in reverse to be decoded in order, and their results collected on
+        # `done` until their parent is decoded.
+        nodes = self._nodes
+        create_node = ctx.expression_manager.create_node
+        convert_payload = self._convert_payload
+        stack = [(msg, False)]
+        done = []
+        while stack:
+            msg, expanded = stack.pop()
+            if msg.ref:
+                done.append(nodes[msg.ref - 1])
+                continue
+            n = len(msg.args)
+            if n and not expanded:
+                stack.append((msg, True))
+                stack.extend([(a, False) for a in reversed(msg.args)])
+                continue
+            args = ()
+            if n:
+                args = tuple(done[-n:])
+                del done[-n:]
+            payload = convert_payload(msg.payload, ctx, param_map)
+            done.append(create_node(msg.type, args, payload))
+        return done[0]
 
     @handles(upf_pb2.Assignment)
-    def _convert_assignment(self, msg, problem, param_map):
-        x = self.convert(msg.x, problem, param_map)
-        v = self.convert(msg.v, problem, param_map)
+    def _convert_assignment(self, msg, ctx, param_map):
+        x = self.convert(msg.x, ctx, param_map)
+        v = self.convert(msg.v, ctx, param_map)
         return x, v
 
     @handles(upf_pb2.Action)
-    def _convert_action(self, msg, problem):
-        op_name = msg.name
+    def _convert_action(self, msg, ctx):
+        names = ctx.symbols
+        if names:
+            op_name = names[msg.name_id]
+            parameters = [names[i] for i in msg.parameter_ids]
+            parameter_types = [names[i] for i in msg.parameter_type_ids]
+        else:
+            op_name = msg.name
+            parameters = msg.parameters
+            parameter_types = msg.parameterTypes
         op_sig = {}
-        for i in range(len(msg.parameters)):
-            p_name = msg.parameters[i]
-            t_name = msg.parameterTypes[i]
-            if t_name in problem.user_types():  # BUG: The conditions should be inverted
+        for i in range(len(parameters)):
+            p_name = parameters[i]
+            t_name = parameter_types[i]
+            if (
+                t_name in ctx.problem.user_types()
+            ):  # BUG: The conditions should be inverted
                 print("Warning: action parameter type not found:", t_name)
                 raise ValueError("Unknown type: " + msg.signatures[i])
             else:
-                op_sig[p_name] = problem.env.type_manager.UserType(
-                    t_name
-                )  # TODO: deal with non user-defined types
+                # TODO: deal with non user-defined types
+                op_sig[p_name] = ctx.type(t_name)
 
         op_upf = upf.model.InstantaneousAction(op_name, **op_sig)
         op_params = {}
         for k in op_sig.keys():
             op_params[k] = op_upf.parameter(k)
 
-        for pre in msg.preconditions:
-            op_upf.add_precondition(self.convert(pre, problem, op_params))
+        outer = self._decode_expressions(msg.expressions, ctx, op_params)
+        try:
+            for pre in msg.preconditions:
+                op_upf.add_precondition(self.convert(pre, ctx, op_params))
 
-        for eff in msg.effects:
-            fluent, value = self.convert(eff, problem, op_params)
-            op_upf.add_effect(fluent, value)
+            for eff in msg.effects:
+                fluent, value = self.convert(eff, ctx, op_params)
+                op_upf.add_effect(fluent, value)
+        finally:
+            self._nodes = outer
         return op_upf
 
     @handles(upf_pb2.Problem)
     def _convert_problem(self, msg, env=None):
         problem = upf.model.Problem(msg.name, env)
-        for fluent in msg.fluents:
-            problem.add_fluent(self.convert(fluent, problem))
+        ctx = DecodeContext(problem, msg.symbols)
+        fluents = []
+        for fluent_msg in msg.fluents:
+            fluent = self.convert(fluent_msg, ctx)
+            ctx.fluents[fluent.name()] = fluent
+            fluents.append(fluent)
 
-        for obj in msg.objects:
-            problem.add_object(self.convert(obj, problem))
+        objects = []
+        for obj_msg in msg.objects:
+            obj = self.convert(obj_msg, ctx)
+            ctx.objects[obj.name()] = obj
+            objects.append(obj)
 
-        for action in msg.actions:
-            problem.add_action(self.convert(action, problem))
+        # Default values may refer to objects, so they are decoded once all
+        # objects are known.
+        for fluent, fluent_msg in zip(fluents, msg.fluents):
+            default = None
+            if fluent_msg.HasField("default_value"):
+                default = self.convert(fluent_msg.default_value, ctx, {})
+            problem.add_fluent(fluent, default_initial_value=default)
 
-        for sva in msg.initialState:
-            fluent, value = self.convert(sva, problem, {})
-            problem.set_initial_value(fluent, value)
+        for obj in objects:
+            problem.add_object(obj)
 
-        for m_goal in msg.goals:
-            goal = self.convert(m_goal, problem, {})
-            problem.add_goal(goal)
+        for action_msg in msg.actions:
+            action = self.convert(action_msg, ctx)
+            problem.add_action(action)
+            ctx.actions[action.name] = action
 
+        self._decode_state(msg, ctx, fluents, objects)
         return problem
 
+    @handles(upf_pb2.ProblemInstance)
+    def _convert_problem_instance(self, msg, domain):
+        # The domain is shared by the instances of a batch, each instance adds
+        # its own objects, initial state and goals to a copy of it.
+        problem = _copy_problem(domain)
+        ctx = DecodeContext(problem, msg.problem.symbols)
+        objects = list(domain.all_objects())
+        for obj_msg in msg.problem.objects:
+            obj = self.convert(obj_msg, ctx)
+            ctx.objects[obj.name()] = obj
+            problem.add_object(obj)
+            objects.append(obj)
+        self._decode_state(msg.problem, ctx, problem.fluents(), objects)
+        return problem
+
+    def _decode_state(self, msg, ctx, fluents, objects):
+        problem = ctx.problem
+        outer = self._decode_expressions(msg.expressions, ctx, {})
+        try:
+            for sva in msg.initialState:
+                fluent, value = self.convert(sva, ctx, {})
+                problem.set_initial_value(fluent, value)
+
+            if msg.HasField("packed_initial_state"):
+                self._decode_packed_initial_state(
+                    msg.packed_initial_state, ctx, fluents, objects
+                )
+
+            for m_goal in msg.goals:
+                goal = self.convert(m_goal, ctx, {})
+                problem.add_goal(goal)
+        finally:
+            self._nodes = outer
+
+    @handles(upf_pb2.ProblemDelta)
+    def _convert_problem_delta(self, msg, problem):
+        # The registered problem is shared between requests, the delta is
+        # applied to a copy of it.
+        patched = _copy_problem(problem)
+        ctx = DecodeContext(patched, msg.symbols)
+        for sva in msg.initialState:
+            fluent, value = self.convert(sva, ctx, {})
+            patched.set_initial_value(fluent, value)
+        if len(msg.goals) > 0:
+            patched.clear_goals()
+            for m_goal in msg.goals:
+                patched.add_goal(self.convert(m_goal, ctx, {}))
+        return patched
+
+    def _decode_packed_initial_state(self, msg, ctx, fluents, objects):
+        n = len(msg.fluent_ids)
+        if n == 0:
+            return
+        em = ctx.expression_manager
+        ids = np.array(msg.fluent_ids, dtype=np.intp)
+        kinds = np.array([value_kind(f.type()) for f in fluents], dtype=np.int8)[ids]
+        arities = np.array([f.arity() for f in fluents], dtype=np.intp)[ids]
+        offsets = np.zeros(n + 1, dtype=np.intp)
+        np.cumsum(arities, out=offsets[1:])
+        object_exps = _object_array([em.ObjectExp(o) for o in objects])
+        args = object_exps[np.array(msg.args, dtype=np.intp)]
+
+        values = np.empty(n, dtype=object)
+        booleans = _object_array([em.FALSE(), em.TRUE()])
+        values[kinds == BOOL_VALUE] = booleans[np.array(msg.bool_values, dtype=np.intp)]
+        values[kinds == INT_VALUE] = _object_array([em.Int(v) for v in msg.int_values])
+        if msg.real_denominators:
+            reals = map(Fraction, msg.real_numerators, msg.real_denominators)
+        else:
+            reals = [Fraction(repr(v)) for v in msg.real_values]
+        values[kinds == REAL_VALUE] = _object_array([em.Real(v) for v in reals])
+        values[kinds == OBJECT_VALUE] = object_exps[
+            np.array(msg.object_values, dtype=np.intp)
+        ]
+
+        problem = ctx.problem
+        entries = zip(_object_array(fluents)[ids], offsets[:-1], offsets[1:], values)
+        for fluent, start, end, value in entries:
+            x = em.FluentExp(fluent, args[start:end].tolist())
+            problem.set_initial_value(x, value)
+
     @handles(upf_pb2.ActionInstance)
-    def _convert_action_instance(self, msg, problem):
-        a = self.convert(msg.action, problem)
-        ps = tuple([self.convert(p, problem, {}) for p in msg.parameters])
+    def _convert_action_instance(self, msg, ctx):
+        if ctx.symbols:
+            a = ctx.actions[ctx.symbols[msg.action_name_id]]
+        elif msg.action_name:
+            a = ctx.actions[msg.action_name]
+        else:
+            a = self.convert(msg.action, ctx)
+        ps = tuple([self.convert(p, ctx, {}) for p in msg.parameters])
         return upf.plan.ActionInstance(a, ps)
 
     @handles(upf_pb2.Answer)
@@ -151,5 +390,6 @@ class FromProtobufConverter(Converter):
         if msg.status > 0:
             return None
         else:
-            ais = [self.convert(ai, problem) for ai in msg.plan.actions]
+            ctx = DecodeContext(problem, msg.symbols)
+            ais = [self.convert(ai, ctx) for ai in msg.plan.actions]
             return upf.plan.SequentialPlan(ais)
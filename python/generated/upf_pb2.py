@@ -1,2001 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: upf.proto
-"""Generated protocol buffer code."""
-from google.protobuf.internal import enum_type_wrapper
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
-from google.protobuf import symbol_database as _symbol_database
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-
-
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='upf.proto',
-  package='',
-  syntax='proto3',
-  serialized_options=None,
-  create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\tupf.proto\"i\n\nExpression\x12\x13\n\x04\x61tom\x18\x01 \x01(\x0b\x32\x05.Atom\x12\x19\n\x04list\x18\x02 \x03(\x0b\x32\x0b.Expression\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x1d\n\x04kind\x18\x04 \x01(\x0e\x32\x0f.ExpressionKind\"V\n\x04\x41tom\x12\x10\n\x06symbol\x18\x01 \x01(\tH\x00\x12\r\n\x03int\x18\x02 \x01(\x03H\x00\x12\x0f\n\x05\x66loat\x18\x03 \x01(\x01H\x00\x12\x11\n\x07\x62oolean\x18\x04 \x01(\x08H\x00\x42\t\n\x07\x63ontent\"9\n\x0fTypeDeclaration\x12\x11\n\ttype_name\x18\x01 \x01(\t\x12\x13\n\x0bparent_type\x18\x02 \x01(\t\"\'\n\tParameter\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\"J\n\x06\x46luent\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\nvalue_type\x18\x02 \x01(\t\x12\x1e\n\nparameters\x18\x03 \x03(\x0b\x32\n.Parameter\"/\n\x11ObjectDeclaration\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\"\xdc\x01\n\x10\x45\x66\x66\x65\x63tExpression\x12*\n\x04kind\x18\x01 \x01(\x0e\x32\x1c.EffectExpression.EffectKind\x12\x1b\n\x06\x66luent\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05value\x18\x03 \x01(\x0b\x32\x0b.Expression\x12\x1e\n\tcondition\x18\x04 \x01(\x0b\x32\x0b.Expression\"C\n\nEffectKind\x12\r\n\tUNDEFINED\x10\x00\x12\n\n\x06\x41SSIGN\x10\x01\x12\x0c\n\x08INCREASE\x10\x02\x12\x0c\n\x08\x44\x45\x43REASE\x10\x03\"L\n\x06\x45\x66\x66\x65\x63t\x12!\n\x06\x65\x66\x66\x65\x63t\x18\x01 \x01(\x0b\x32\x11.EffectExpression\x12\x1f\n\x0eoccurence_time\x18\x02 \x01(\x0b\x32\x07.Timing\"C\n\tCondition\x12\x19\n\x04\x63ond\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1b\n\x04span\x18\x02 \x01(\x0b\x32\r.TimeInterval\"\xa8\x01\n\x06\x41\x63tion\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1e\n\nparameters\x18\x02 \x03(\x0b\x32\n.Parameter\x12\x1b\n\x08\x64uration\x18\x03 \x01(\x0b\x32\t.Duration\x12\x1e\n\nconditions\x18\x04 \x03(\x0b\x32\n.Condition\x12\x18\n\x07\x65\x66\x66\x65\x63ts\x18\x05 \x03(\x0b\x32\x07.Effect\x12\x19\n\x04\x63ost\x18\x06 \x01(\x0b\x32\x0b.Expression\"z\n\tTimepoint\x12&\n\x04kind\x18\x01 \x01(\x0e\x32\x18.Timepoint.TimepointKind\"E\n\rTimepointKind\x12\x10\n\x0cGLOBAL_START\x10\x00\x12\x0e\n\nGLOBAL_END\x10\x01\x12\t\n\x05START\x10\x02\x12\x07\n\x03\x45ND\x10\x03\"6\n\x06Timing\x12\x1d\n\ttimepoint\x18\x01 \x01(\x0b\x32\n.Timepoint\x12\r\n\x05\x64\x65lay\x18\x02 \x01(\x01\"o\n\x08Interval\x12\x14\n\x0cis_left_open\x18\x01 \x01(\x08\x12\x1a\n\x05lower\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x15\n\ris_right_open\x18\x03 \x01(\x08\x12\x1a\n\x05upper\x18\x04 \x01(\x0b\x32\x0b.Expression\"k\n\x0cTimeInterval\x12\x14\n\x0cis_left_open\x18\x01 \x01(\x08\x12\x16\n\x05lower\x18\x02 \x01(\x0b\x32\x07.Timing\x12\x15\n\ris_right_open\x18\x03 \x01(\x08\x12\x16\n\x05upper\x18\x04 \x01(\x0b\x32\x07.Timing\"5\n\x08\x44uration\x12)\n\x16\x63ontrollable_in_bounds\x18\x01 \x01(\x0b\x32\t.Interval\"@\n\x04Goal\x12\x19\n\x04goal\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1d\n\x06timing\x18\x02 \x01(\x0b\x32\r.TimeInterval\"Q\n\x0bTimedEffect\x12!\n\x06\x65\x66\x66\x65\x63t\x18\x01 \x01(\x0b\x32\x11.EffectExpression\x12\x1f\n\x0eoccurence_time\x18\x02 \x01(\x0b\x32\x07.Timing\"E\n\nAssignment\x12\x1b\n\x06\x66luent\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05value\x18\x02 \x01(\x0b\x32\x0b.Expression\"\xa9\x02\n\x07Problem\x12\x13\n\x0b\x64omain_name\x18\x01 \x01(\t\x12\x14\n\x0cproblem_name\x18\x02 \x01(\t\x12\x1f\n\x05types\x18\x03 \x03(\x0b\x32\x10.TypeDeclaration\x12\x18\n\x07\x66luents\x18\x04 \x03(\x0b\x32\x07.Fluent\x12#\n\x07objects\x18\x05 \x03(\x0b\x32\x12.ObjectDeclaration\x12\x18\n\x07\x61\x63tions\x18\x06 \x03(\x0b\x32\x07.Action\x12\"\n\rinitial_state\x18\x07 \x03(\x0b\x32\x0b.Assignment\x12#\n\rtimed_effects\x18\x08 \x03(\x0b\x32\x0c.TimedEffect\x12\x14\n\x05goals\x18\t \x03(\x0b\x32\x05.Goal\x12\x1a\n\x08\x66\x65\x61tures\x18\x0f \x03(\x0e\x32\x08.Feature\"r\n\x0e\x41\x63tionInstance\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0b\x61\x63tion_name\x18\x02 \x01(\t\x12\x19\n\nparameters\x18\x03 \x03(\x0b\x32\x05.Atom\x12\x12\n\nstart_time\x18\x04 \x01(\x01\x12\x10\n\x08\x65nd_time\x18\x05 \x01(\x01\"(\n\x04Plan\x12 \n\x07\x61\x63tions\x18\x01 \x03(\x0b\x32\x0f.ActionInstance\"\x85\x02\n\x0bPlanRequest\x12\x19\n\x07problem\x18\x01 \x01(\x0b\x32\x08.Problem\x12*\n\x0fresolution_mode\x18\x02 \x01(\x0e\x32\x11.PlanRequest.Mode\x12\x17\n\x0ftimeout_seconds\x18\x03 \x01(\x01\x12\x39\n\x0fplanner_options\x18\x04 \x03(\x0b\x32 .PlanRequest.PlannerOptionsEntry\x1a\x35\n\x13PlannerOptionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"$\n\x04Mode\x12\x0f\n\x0bSATISFIABLE\x10\x00\x12\x0b\n\x07OPTIMAL\x10\x01\"{\n\nLogMessage\x12#\n\x05level\x18\x01 \x01(\x0e\x32\x14.LogMessage.LogLevel\x12\x0f\n\x07message\x18\x02 \x01(\t\"7\n\x08LogLevel\x12\t\n\x05\x44\x45\x42UG\x10\x00\x12\x08\n\x04INFO\x10\x01\x12\x0b\n\x07WARNING\x10\x02\x12\t\n\x05\x45RROR\x10\x03\"\xa7\x01\n\x12IntermediateReport\x12\x13\n\x04plan\x18\x01 \x01(\x0b\x32\x05.Plan\x12\x19\n\x04logs\x18\x02 \x03(\x0b\x32\x0b.LogMessage\x12\x31\n\x07metrics\x18\x03 \x03(\x0b\x32 .IntermediateReport.MetricsEntry\x1a.\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xcd\x02\n\x0b\x46inalReport\x12#\n\x06status\x18\x01 \x01(\x0e\x32\x13.FinalReport.Status\x12\x18\n\tbest_plan\x18\x02 \x01(\x0b\x32\x05.Plan\x12*\n\x07metrics\x18\x03 \x03(\x0b\x32\x19.FinalReport.MetricsEntry\x12\x19\n\x04logs\x18\x04 \x03(\x0b\x32\x0b.LogMessage\x1a.\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x87\x01\n\x06Status\x12\x07\n\x03SAT\x10\x00\x12\x07\n\x03OPT\x10\x01\x12\t\n\x05UNSAT\x10\x02\x12\x1a\n\x16SEARCH_SPACE_EXHAUSTED\x10\x03\x12\x0b\n\x07TIMEOUT\x10\r\x12\n\n\x06MEMOUT\x10\x0e\x12\x12\n\x0eINTERNAL_ERROR\x10\x0f\x12\x17\n\x13UNSUPPORTED_PROBLEM\x10\x10\"_\n\x06\x41nswer\x12+\n\x0cintermediate\x18\x01 \x01(\x0b\x32\x13.IntermediateReportH\x00\x12\x1d\n\x05\x66inal\x18\x02 \x01(\x0b\x32\x0c.FinalReportH\x00\x42\t\n\x07\x63ontent*\x90\x01\n\x0e\x45xpressionKind\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0c\n\x08\x43ONSTANT\x10\x01\x12\r\n\tPARAMETER\x10\x02\x12\x11\n\rFLUENT_SYMBOL\x10\x03\x12\x13\n\x0f\x46UNCTION_SYMBOL\x10\x04\x12\x12\n\x0eSTATE_VARIABLE\x10\x05\x12\x18\n\x14\x46UNCTION_APPLICATION\x10\x06*n\n\x07\x46\x65\x61ture\x12\x14\n\x10\x44URATIVE_ACTIONS\x10\x00\x12\x17\n\x13\x43ONDITIONAL_EFFECTS\x10\x01\x12\x10\n\x0c\x41\x43TION_COSTS\x10\x02\x12\x11\n\rTIMED_EFFECTS\x10\x03\x12\x0f\n\x0bTIMED_GOALS\x10\x04\x32\x39\n\x0fUnifiedPlanning\x12&\n\x0bplanOneShot\x12\x0c.PlanRequest\x1a\x07.Answer0\x01\x62\x06proto3'
-)
-
-_EXPRESSIONKIND = _descriptor.EnumDescriptor(
-  name='ExpressionKind',
-  full_name='ExpressionKind',
-  filename=None,
-  file=DESCRIPTOR,
-  create_key=_descriptor._internal_create_key,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='UNKNOWN', index=0, number=0,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='CONSTANT', index=1, number=1,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='PARAMETER', index=2, number=2,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='FLUENT_SYMBOL', index=3, number=3,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='FUNCTION_SYMBOL', index=4, number=4,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='STATE_VARIABLE', index=5, number=5,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='FUNCTION_APPLICATION', index=6, number=6,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=3102,
-  serialized_end=3246,
-)
-_sym_db.RegisterEnumDescriptor(_EXPRESSIONKIND)
-
-ExpressionKind = enum_type_wrapper.EnumTypeWrapper(_EXPRESSIONKIND)
-_FEATURE = _descriptor.EnumDescriptor(
-  name='Feature',
-  full_name='Feature',
-  filename=None,
-  file=DESCRIPTOR,
-  create_key=_descriptor._internal_create_key,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='DURATIVE_ACTIONS', index=0, number=0,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='CONDITIONAL_EFFECTS', index=1, number=1,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='ACTION_COSTS', index=2, number=2,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='TIMED_EFFECTS', index=3, number=3,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='TIMED_GOALS', index=4, number=4,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=3248,
-  serialized_end=3358,
-)
-_sym_db.RegisterEnumDescriptor(_FEATURE)
-
-Feature = enum_type_wrapper.EnumTypeWrapper(_FEATURE)
-UNKNOWN = 0
-CONSTANT = 1
-PARAMETER = 2
-FLUENT_SYMBOL = 3
-FUNCTION_SYMBOL = 4
-STATE_VARIABLE = 5
-FUNCTION_APPLICATION = 6
-DURATIVE_ACTIONS = 0
-CONDITIONAL_EFFECTS = 1
-ACTION_COSTS = 2
-TIMED_EFFECTS = 3
-TIMED_GOALS = 4
-
-
-_EFFECTEXPRESSION_EFFECTKIND = _descriptor.EnumDescriptor(
-  name='EffectKind',
-  full_name='EffectExpression.EffectKind',
-  filename=None,
-  file=DESCRIPTOR,
-  create_key=_descriptor._internal_create_key,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='UNDEFINED', index=0, number=0,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='ASSIGN', index=1, number=1,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='INCREASE', index=2, number=2,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='DECREASE', index=3, number=3,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=587,
-  serialized_end=654,
-)
-_sym_db.RegisterEnumDescriptor(_EFFECTEXPRESSION_EFFECTKIND)
-
-_TIMEPOINT_TIMEPOINTKIND = _descriptor.EnumDescriptor(
-  name='TimepointKind',
-  full_name='Timepoint.TimepointKind',
-  filename=None,
-  file=DESCRIPTOR,
-  create_key=_descriptor._internal_create_key,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='GLOBAL_START', index=0, number=0,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='GLOBAL_END', index=1, number=1,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='START', index=2, number=2,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='END', index=3, number=3,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=1027,
-  serialized_end=1096,
-)
-_sym_db.RegisterEnumDescriptor(_TIMEPOINT_TIMEPOINTKIND)
-
-_PLANREQUEST_MODE = _descriptor.EnumDescriptor(
-  name='Mode',
-  full_name='PlanRequest.Mode',
-  filename=None,
-  file=DESCRIPTOR,
-  create_key=_descriptor._internal_create_key,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='SATISFIABLE', index=0, number=0,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='OPTIMAL', index=1, number=1,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=2335,
-  serialized_end=2371,
-)
-_sym_db.RegisterEnumDescriptor(_PLANREQUEST_MODE)
-
-_LOGMESSAGE_LOGLEVEL = _descriptor.EnumDescriptor(
-  name='LogLevel',
-  full_name='LogMessage.LogLevel',
-  filename=None,
-  file=DESCRIPTOR,
-  create_key=_descriptor._internal_create_key,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='DEBUG', index=0, number=0,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='INFO', index=1, number=1,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='WARNING', index=2, number=2,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='ERROR', index=3, number=3,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=2441,
-  serialized_end=2496,
-)
-_sym_db.RegisterEnumDescriptor(_LOGMESSAGE_LOGLEVEL)
-
-_FINALREPORT_STATUS = _descriptor.EnumDescriptor(
-  name='Status',
-  full_name='FinalReport.Status',
-  filename=None,
-  file=DESCRIPTOR,
-  create_key=_descriptor._internal_create_key,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='SAT', index=0, number=0,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='OPT', index=1, number=1,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='UNSAT', index=2, number=2,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='SEARCH_SPACE_EXHAUSTED', index=3, number=3,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='TIMEOUT', index=4, number=13,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='MEMOUT', index=5, number=14,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='INTERNAL_ERROR', index=6, number=15,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='UNSUPPORTED_PROBLEM', index=7, number=16,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=2867,
-  serialized_end=3002,
-)
-_sym_db.RegisterEnumDescriptor(_FINALREPORT_STATUS)
-
-
-_EXPRESSION = _descriptor.Descriptor(
-  name='Expression',
-  full_name='Expression',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='atom', full_name='Expression.atom', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='list', full_name='Expression.list', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='Expression.type', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='kind', full_name='Expression.kind', index=3,
-      number=4, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=13,
-  serialized_end=118,
-)
-
-
-_ATOM = _descriptor.Descriptor(
-  name='Atom',
-  full_name='Atom',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='symbol', full_name='Atom.symbol', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='int', full_name='Atom.int', index=1,
-      number=2, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='float', full_name='Atom.float', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='boolean', full_name='Atom.boolean', index=3,
-      number=4, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='content', full_name='Atom.content',
-      index=0, containing_type=None,
-      create_key=_descriptor._internal_create_key,
-    fields=[]),
-  ],
-  serialized_start=120,
-  serialized_end=206,
-)
-
-
-_TYPEDECLARATION = _descriptor.Descriptor(
-  name='TypeDeclaration',
-  full_name='TypeDeclaration',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='type_name', full_name='TypeDeclaration.type_name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='parent_type', full_name='TypeDeclaration.parent_type', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=208,
-  serialized_end=265,
-)
-
-
-_PARAMETER = _descriptor.Descriptor(
-  name='Parameter',
-  full_name='Parameter',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='Parameter.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='Parameter.type', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=267,
-  serialized_end=306,
-)
-
-
-_FLUENT = _descriptor.Descriptor(
-  name='Fluent',
-  full_name='Fluent',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='Fluent.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value_type', full_name='Fluent.value_type', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='parameters', full_name='Fluent.parameters', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=308,
-  serialized_end=382,
-)
-
-
-_OBJECTDECLARATION = _descriptor.Descriptor(
-  name='ObjectDeclaration',
-  full_name='ObjectDeclaration',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='ObjectDeclaration.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='ObjectDeclaration.type', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=384,
-  serialized_end=431,
-)
-
-
-_EFFECTEXPRESSION = _descriptor.Descriptor(
-  name='EffectExpression',
-  full_name='EffectExpression',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='kind', full_name='EffectExpression.kind', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='fluent', full_name='EffectExpression.fluent', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='EffectExpression.value', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='condition', full_name='EffectExpression.condition', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _EFFECTEXPRESSION_EFFECTKIND,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=434,
-  serialized_end=654,
-)
-
-
-_EFFECT = _descriptor.Descriptor(
-  name='Effect',
-  full_name='Effect',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='effect', full_name='Effect.effect', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='occurence_time', full_name='Effect.occurence_time', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=656,
-  serialized_end=732,
-)
-
-
-_CONDITION = _descriptor.Descriptor(
-  name='Condition',
-  full_name='Condition',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='cond', full_name='Condition.cond', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='span', full_name='Condition.span', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=734,
-  serialized_end=801,
-)
-
-
-_ACTION = _descriptor.Descriptor(
-  name='Action',
-  full_name='Action',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='Action.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='parameters', full_name='Action.parameters', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='duration', full_name='Action.duration', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='conditions', full_name='Action.conditions', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='effects', full_name='Action.effects', index=4,
-      number=5, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='cost', full_name='Action.cost', index=5,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=804,
-  serialized_end=972,
-)
-
-
-_TIMEPOINT = _descriptor.Descriptor(
-  name='Timepoint',
-  full_name='Timepoint',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='kind', full_name='Timepoint.kind', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _TIMEPOINT_TIMEPOINTKIND,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=974,
-  serialized_end=1096,
-)
-
-
-_TIMING = _descriptor.Descriptor(
-  name='Timing',
-  full_name='Timing',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='timepoint', full_name='Timing.timepoint', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='delay', full_name='Timing.delay', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1098,
-  serialized_end=1152,
-)
-
-
-_INTERVAL = _descriptor.Descriptor(
-  name='Interval',
-  full_name='Interval',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='is_left_open', full_name='Interval.is_left_open', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='lower', full_name='Interval.lower', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='is_right_open', full_name='Interval.is_right_open', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='upper', full_name='Interval.upper', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1154,
-  serialized_end=1265,
-)
-
-
-_TIMEINTERVAL = _descriptor.Descriptor(
-  name='TimeInterval',
-  full_name='TimeInterval',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='is_left_open', full_name='TimeInterval.is_left_open', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='lower', full_name='TimeInterval.lower', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='is_right_open', full_name='TimeInterval.is_right_open', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='upper', full_name='TimeInterval.upper', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1267,
-  serialized_end=1374,
-)
-
-
-_DURATION = _descriptor.Descriptor(
-  name='Duration',
-  full_name='Duration',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='controllable_in_bounds', full_name='Duration.controllable_in_bounds', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1376,
-  serialized_end=1429,
-)
-
-
-_GOAL = _descriptor.Descriptor(
-  name='Goal',
-  full_name='Goal',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='goal', full_name='Goal.goal', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timing', full_name='Goal.timing', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1431,
-  serialized_end=1495,
-)
-
-
-_TIMEDEFFECT = _descriptor.Descriptor(
-  name='TimedEffect',
-  full_name='TimedEffect',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='effect', full_name='TimedEffect.effect', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='occurence_time', full_name='TimedEffect.occurence_time', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1497,
-  serialized_end=1578,
-)
-
-
-_ASSIGNMENT = _descriptor.Descriptor(
-  name='Assignment',
-  full_name='Assignment',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='fluent', full_name='Assignment.fluent', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='Assignment.value', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1580,
-  serialized_end=1649,
-)
-
-
-_PROBLEM = _descriptor.Descriptor(
-  name='Problem',
-  full_name='Problem',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='domain_name', full_name='Problem.domain_name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='problem_name', full_name='Problem.problem_name', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='types', full_name='Problem.types', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='fluents', full_name='Problem.fluents', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='objects', full_name='Problem.objects', index=4,
-      number=5, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='actions', full_name='Problem.actions', index=5,
-      number=6, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='initial_state', full_name='Problem.initial_state', index=6,
-      number=7, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timed_effects', full_name='Problem.timed_effects', index=7,
-      number=8, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='goals', full_name='Problem.goals', index=8,
-      number=9, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='features', full_name='Problem.features', index=9,
-      number=15, type=14, cpp_type=8, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1652,
-  serialized_end=1949,
-)
-
-
-_ACTIONINSTANCE = _descriptor.Descriptor(
-  name='ActionInstance',
-  full_name='ActionInstance',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='ActionInstance.id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='action_name', full_name='ActionInstance.action_name', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='parameters', full_name='ActionInstance.parameters', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='start_time', full_name='ActionInstance.start_time', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='end_time', full_name='ActionInstance.end_time', index=4,
-      number=5, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1951,
-  serialized_end=2065,
-)
-
-
-_PLAN = _descriptor.Descriptor(
-  name='Plan',
-  full_name='Plan',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='actions', full_name='Plan.actions', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2067,
-  serialized_end=2107,
-)
-
-
-_PLANREQUEST_PLANNEROPTIONSENTRY = _descriptor.Descriptor(
-  name='PlannerOptionsEntry',
-  full_name='PlanRequest.PlannerOptionsEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='PlanRequest.PlannerOptionsEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='PlanRequest.PlannerOptionsEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=b'8\001',
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2280,
-  serialized_end=2333,
-)
-
-_PLANREQUEST = _descriptor.Descriptor(
-  name='PlanRequest',
-  full_name='PlanRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='problem', full_name='PlanRequest.problem', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='resolution_mode', full_name='PlanRequest.resolution_mode', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timeout_seconds', full_name='PlanRequest.timeout_seconds', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='planner_options', full_name='PlanRequest.planner_options', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[_PLANREQUEST_PLANNEROPTIONSENTRY, ],
-  enum_types=[
-    _PLANREQUEST_MODE,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2110,
-  serialized_end=2371,
-)
-
-
-_LOGMESSAGE = _descriptor.Descriptor(
-  name='LogMessage',
-  full_name='LogMessage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='level', full_name='LogMessage.level', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='message', full_name='LogMessage.message', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _LOGMESSAGE_LOGLEVEL,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2373,
-  serialized_end=2496,
-)
-
-
-_INTERMEDIATEREPORT_METRICSENTRY = _descriptor.Descriptor(
-  name='MetricsEntry',
-  full_name='IntermediateReport.MetricsEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='IntermediateReport.MetricsEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='IntermediateReport.MetricsEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=b'8\001',
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2620,
-  serialized_end=2666,
-)
-
-_INTERMEDIATEREPORT = _descriptor.Descriptor(
-  name='IntermediateReport',
-  full_name='IntermediateReport',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='plan', full_name='IntermediateReport.plan', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='logs', full_name='IntermediateReport.logs', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='metrics', full_name='IntermediateReport.metrics', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[_INTERMEDIATEREPORT_METRICSENTRY, ],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2499,
-  serialized_end=2666,
-)
-
-
-_FINALREPORT_METRICSENTRY = _descriptor.Descriptor(
-  name='MetricsEntry',
-  full_name='FinalReport.MetricsEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='FinalReport.MetricsEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='FinalReport.MetricsEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=b'8\001',
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2620,
-  serialized_end=2666,
-)
-
-_FINALREPORT = _descriptor.Descriptor(
-  name='FinalReport',
-  full_name='FinalReport',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='status', full_name='FinalReport.status', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='best_plan', full_name='FinalReport.best_plan', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='metrics', full_name='FinalReport.metrics', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='logs', full_name='FinalReport.logs', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[_FINALREPORT_METRICSENTRY, ],
-  enum_types=[
-    _FINALREPORT_STATUS,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2669,
-  serialized_end=3002,
-)
-
-
-_ANSWER = _descriptor.Descriptor(
-  name='Answer',
-  full_name='Answer',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='intermediate', full_name='Answer.intermediate', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='final', full_name='Answer.final', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='content', full_name='Answer.content',
-      index=0, containing_type=None,
-      create_key=_descriptor._internal_create_key,
-    fields=[]),
-  ],
-  serialized_start=3004,
-  serialized_end=3099,
-)
-
-_EXPRESSION.fields_by_name['atom'].message_type = _ATOM
-_EXPRESSION.fields_by_name['list'].message_type = _EXPRESSION
-_EXPRESSION.fields_by_name['kind'].enum_type = _EXPRESSIONKIND
-_ATOM.oneofs_by_name['content'].fields.append(
-  _ATOM.fields_by_name['symbol'])
-_ATOM.fields_by_name['symbol'].containing_oneof = _ATOM.oneofs_by_name['content']
-_ATOM.oneofs_by_name['content'].fields.append(
-  _ATOM.fields_by_name['int'])
-_ATOM.fields_by_name['int'].containing_oneof = _ATOM.oneofs_by_name['content']
-_ATOM.oneofs_by_name['content'].fields.append(
-  _ATOM.fields_by_name['float'])
-_ATOM.fields_by_name['float'].containing_oneof = _ATOM.oneofs_by_name['content']
-_ATOM.oneofs_by_name['content'].fields.append(
-  _ATOM.fields_by_name['boolean'])
-_ATOM.fields_by_name['boolean'].containing_oneof = _ATOM.oneofs_by_name['content']
-_FLUENT.fields_by_name['parameters'].message_type = _PARAMETER
-_EFFECTEXPRESSION.fields_by_name['kind'].enum_type = _EFFECTEXPRESSION_EFFECTKIND
-_EFFECTEXPRESSION.fields_by_name['fluent'].message_type = _EXPRESSION
-_EFFECTEXPRESSION.fields_by_name['value'].message_type = _EXPRESSION
-_EFFECTEXPRESSION.fields_by_name['condition'].message_type = _EXPRESSION
-_EFFECTEXPRESSION_EFFECTKIND.containing_type = _EFFECTEXPRESSION
-_EFFECT.fields_by_name['effect'].message_type = _EFFECTEXPRESSION
-_EFFECT.fields_by_name['occurence_time'].message_type = _TIMING
-_CONDITION.fields_by_name['cond'].message_type = _EXPRESSION
-_CONDITION.fields_by_name['span'].message_type = _TIMEINTERVAL
-_ACTION.fields_by_name['parameters'].message_type = _PARAMETER
-_ACTION.fields_by_name['duration'].message_type = _DURATION
-_ACTION.fields_by_name['conditions'].message_type = _CONDITION
-_ACTION.fields_by_name['effects'].message_type = _EFFECT
-_ACTION.fields_by_name['cost'].message_type = _EXPRESSION
-_TIMEPOINT.fields_by_name['kind'].enum_type = _TIMEPOINT_TIMEPOINTKIND
-_TIMEPOINT_TIMEPOINTKIND.containing_type = _TIMEPOINT
-_TIMING.fields_by_name['timepoint'].message_type = _TIMEPOINT
-_INTERVAL.fields_by_name['lower'].message_type = _EXPRESSION
-_INTERVAL.fields_by_name['upper'].message_type = _EXPRESSION
-_TIMEINTERVAL.fields_by_name['lower'].message_type = _TIMING
-_TIMEINTERVAL.fields_by_name['upper'].message_type = _TIMING
-_DURATION.fields_by_name['controllable_in_bounds'].message_type = _INTERVAL
-_GOAL.fields_by_name['goal'].message_type = _EXPRESSION
-_GOAL.fields_by_name['timing'].message_type = _TIMEINTERVAL
-_TIMEDEFFECT.fields_by_name['effect'].message_type = _EFFECTEXPRESSION
-_TIMEDEFFECT.fields_by_name['occurence_time'].message_type = _TIMING
-_ASSIGNMENT.fields_by_name['fluent'].message_type = _EXPRESSION
-_ASSIGNMENT.fields_by_name['value'].message_type = _EXPRESSION
-_PROBLEM.fields_by_name['types'].message_type = _TYPEDECLARATION
-_PROBLEM.fields_by_name['fluents'].message_type = _FLUENT
-_PROBLEM.fields_by_name['objects'].message_type = _OBJECTDECLARATION
-_PROBLEM.fields_by_name['actions'].message_type = _ACTION
-_PROBLEM.fields_by_name['initial_state'].message_type = _ASSIGNMENT
-_PROBLEM.fields_by_name['timed_effects'].message_type = _TIMEDEFFECT
-_PROBLEM.fields_by_name['goals'].message_type = _GOAL
-_PROBLEM.fields_by_name['features'].enum_type = _FEATURE
-_ACTIONINSTANCE.fields_by_name['parameters'].message_type = _ATOM
-_PLAN.fields_by_name['actions'].message_type = _ACTIONINSTANCE
-_PLANREQUEST_PLANNEROPTIONSENTRY.containing_type = _PLANREQUEST
-_PLANREQUEST.fields_by_name['problem'].message_type = _PROBLEM
-_PLANREQUEST.fields_by_name['resolution_mode'].enum_type = _PLANREQUEST_MODE
-_PLANREQUEST.fields_by_name['planner_options'].message_type = _PLANREQUEST_PLANNEROPTIONSENTRY
-_PLANREQUEST_MODE.containing_type = _PLANREQUEST
-_LOGMESSAGE.fields_by_name['level'].enum_type = _LOGMESSAGE_LOGLEVEL
-_LOGMESSAGE_LOGLEVEL.containing_type = _LOGMESSAGE
-_INTERMEDIATEREPORT_METRICSENTRY.containing_type = _INTERMEDIATEREPORT
-_INTERMEDIATEREPORT.fields_by_name['plan'].message_type = _PLAN
-_INTERMEDIATEREPORT.fields_by_name['logs'].message_type = _LOGMESSAGE
-_INTERMEDIATEREPORT.fields_by_name['metrics'].message_type = _INTERMEDIATEREPORT_METRICSENTRY
-_FINALREPORT_METRICSENTRY.containing_type = _FINALREPORT
-_FINALREPORT.fields_by_name['status'].enum_type = _FINALREPORT_STATUS
-_FINALREPORT.fields_by_name['best_plan'].message_type = _PLAN
-_FINALREPORT.fields_by_name['metrics'].message_type = _FINALREPORT_METRICSENTRY
-_FINALREPORT.fields_by_name['logs'].message_type = _LOGMESSAGE
-_FINALREPORT_STATUS.containing_type = _FINALREPORT
-_ANSWER.fields_by_name['intermediate'].message_type = _INTERMEDIATEREPORT
-_ANSWER.fields_by_name['final'].message_type = _FINALREPORT
-_ANSWER.oneofs_by_name['content'].fields.append(
-  _ANSWER.fields_by_name['intermediate'])
-_ANSWER.fields_by_name['intermediate'].containing_oneof = _ANSWER.oneofs_by_name['content']
-_ANSWER.oneofs_by_name['content'].fields.append(
-  _ANSWER.fields_by_name['final'])
-_ANSWER.fields_by_name['final'].containing_oneof = _ANSWER.oneofs_by_name['content']
-DESCRIPTOR.message_types_by_name['Expression'] = _EXPRESSION
-DESCRIPTOR.message_types_by_name['Atom'] = _ATOM
-DESCRIPTOR.message_types_by_name['TypeDeclaration'] = _TYPEDECLARATION
-DESCRIPTOR.message_types_by_name['Parameter'] = _PARAMETER
-DESCRIPTOR.message_types_by_name['Fluent'] = _FLUENT
-DESCRIPTOR.message_types_by_name['ObjectDeclaration'] = _OBJECTDECLARATION
-DESCRIPTOR.message_types_by_name['EffectExpression'] = _EFFECTEXPRESSION
-DESCRIPTOR.message_types_by_name['Effect'] = _EFFECT
-DESCRIPTOR.message_types_by_name['Condition'] = _CONDITION
-DESCRIPTOR.message_types_by_name['Action'] = _ACTION
-DESCRIPTOR.message_types_by_name['Timepoint'] = _TIMEPOINT
-DESCRIPTOR.message_types_by_name['Timing'] = _TIMING
-DESCRIPTOR.message_types_by_name['Interval'] = _INTERVAL
-DESCRIPTOR.message_types_by_name['TimeInterval'] = _TIMEINTERVAL
-DESCRIPTOR.message_types_by_name['Duration'] = _DURATION
-DESCRIPTOR.message_types_by_name['Goal'] = _GOAL
-DESCRIPTOR.message_types_by_name['TimedEffect'] = _TIMEDEFFECT
-DESCRIPTOR.message_types_by_name['Assignment'] = _ASSIGNMENT
-DESCRIPTOR.message_types_by_name['Problem'] = _PROBLEM
-DESCRIPTOR.message_types_by_name['ActionInstance'] = _ACTIONINSTANCE
-DESCRIPTOR.message_types_by_name['Plan'] = _PLAN
-DESCRIPTOR.message_types_by_name['PlanRequest'] = _PLANREQUEST
-DESCRIPTOR.message_types_by_name['LogMessage'] = _LOGMESSAGE
-DESCRIPTOR.message_types_by_name['IntermediateReport'] = _INTERMEDIATEREPORT
-DESCRIPTOR.message_types_by_name['FinalReport'] = _FINALREPORT
-DESCRIPTOR.message_types_by_name['Answer'] = _ANSWER
-DESCRIPTOR.enum_types_by_name['ExpressionKind'] = _EXPRESSIONKIND
-DESCRIPTOR.enum_types_by_name['Feature'] = _FEATURE
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-Expression = _reflection.GeneratedProtocolMessageType('Expression', (_message.Message,), {
-  'DESCRIPTOR' : _EXPRESSION,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Expression)
-  })
-_sym_db.RegisterMessage(Expression)
-
-Atom = _reflection.GeneratedProtocolMessageType('Atom', (_message.Message,), {
-  'DESCRIPTOR' : _ATOM,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Atom)
-  })
-_sym_db.RegisterMessage(Atom)
-
-TypeDeclaration = _reflection.GeneratedProtocolMessageType('TypeDeclaration', (_message.Message,), {
-  'DESCRIPTOR' : _TYPEDECLARATION,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:TypeDeclaration)
-  })
-_sym_db.RegisterMessage(TypeDeclaration)
-
-Parameter = _reflection.GeneratedProtocolMessageType('Parameter', (_message.Message,), {
-  'DESCRIPTOR' : _PARAMETER,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Parameter)
-  })
-_sym_db.RegisterMessage(Parameter)
-
-Fluent = _reflection.GeneratedProtocolMessageType('Fluent', (_message.Message,), {
-  'DESCRIPTOR' : _FLUENT,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Fluent)
-  })
-_sym_db.RegisterMessage(Fluent)
-
-ObjectDeclaration = _reflection.GeneratedProtocolMessageType('ObjectDeclaration', (_message.Message,), {
-  'DESCRIPTOR' : _OBJECTDECLARATION,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:ObjectDeclaration)
-  })
-_sym_db.RegisterMessage(ObjectDeclaration)
-
-EffectExpression = _reflection.GeneratedProtocolMessageType('EffectExpression', (_message.Message,), {
-  'DESCRIPTOR' : _EFFECTEXPRESSION,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:EffectExpression)
-  })
-_sym_db.RegisterMessage(EffectExpression)
-
-Effect = _reflection.GeneratedProtocolMessageType('Effect', (_message.Message,), {
-  'DESCRIPTOR' : _EFFECT,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Effect)
-  })
-_sym_db.RegisterMessage(Effect)
-
-Condition = _reflection.GeneratedProtocolMessageType('Condition', (_message.Message,), {
-  'DESCRIPTOR' : _CONDITION,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Condition)
-  })
-_sym_db.RegisterMessage(Condition)
-
-Action = _reflection.GeneratedProtocolMessageType('Action', (_message.Message,), {
-  'DESCRIPTOR' : _ACTION,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Action)
-  })
-_sym_db.RegisterMessage(Action)
-
-Timepoint = _reflection.GeneratedProtocolMessageType('Timepoint', (_message.Message,), {
-  'DESCRIPTOR' : _TIMEPOINT,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Timepoint)
-  })
-_sym_db.RegisterMessage(Timepoint)
-
-Timing = _reflection.GeneratedProtocolMessageType('Timing', (_message.Message,), {
-  'DESCRIPTOR' : _TIMING,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Timing)
-  })
-_sym_db.RegisterMessage(Timing)
-
-Interval = _reflection.GeneratedProtocolMessageType('Interval', (_message.Message,), {
-  'DESCRIPTOR' : _INTERVAL,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Interval)
-  })
-_sym_db.RegisterMessage(Interval)
-
-TimeInterval = _reflection.GeneratedProtocolMessageType('TimeInterval', (_message.Message,), {
-  'DESCRIPTOR' : _TIMEINTERVAL,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:TimeInterval)
-  })
-_sym_db.RegisterMessage(TimeInterval)
-
-Duration = _reflection.GeneratedProtocolMessageType('Duration', (_message.Message,), {
-  'DESCRIPTOR' : _DURATION,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Duration)
-  })
-_sym_db.RegisterMessage(Duration)
-
-Goal = _reflection.GeneratedProtocolMessageType('Goal', (_message.Message,), {
-  'DESCRIPTOR' : _GOAL,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Goal)
-  })
-_sym_db.RegisterMessage(Goal)
-
-TimedEffect = _reflection.GeneratedProtocolMessageType('TimedEffect', (_message.Message,), {
-  'DESCRIPTOR' : _TIMEDEFFECT,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:TimedEffect)
-  })
-_sym_db.RegisterMessage(TimedEffect)
-
-Assignment = _reflection.GeneratedProtocolMessageType('Assignment', (_message.Message,), {
-  'DESCRIPTOR' : _ASSIGNMENT,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Assignment)
-  })
-_sym_db.RegisterMessage(Assignment)
-
-Problem = _reflection.GeneratedProtocolMessageType('Problem', (_message.Message,), {
-  'DESCRIPTOR' : _PROBLEM,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Problem)
-  })
-_sym_db.RegisterMessage(Problem)
-
-ActionInstance = _reflection.GeneratedProtocolMessageType('ActionInstance', (_message.Message,), {
-  'DESCRIPTOR' : _ACTIONINSTANCE,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:ActionInstance)
-  })
-_sym_db.RegisterMessage(ActionInstance)
-
-Plan = _reflection.GeneratedProtocolMessageType('Plan', (_message.Message,), {
-  'DESCRIPTOR' : _PLAN,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Plan)
-  })
-_sym_db.RegisterMessage(Plan)
-
-PlanRequest = _reflection.GeneratedProtocolMessageType('PlanRequest', (_message.Message,), {
-
-  'PlannerOptionsEntry' : _reflection.GeneratedProtocolMessageType('PlannerOptionsEntry', (_message.Message,), {
-    'DESCRIPTOR' : _PLANREQUEST_PLANNEROPTIONSENTRY,
-    '__module__' : 'upf_pb2'
-    # @@protoc_insertion_point(class_scope:PlanRequest.PlannerOptionsEntry)
-    })
-  ,
-  'DESCRIPTOR' : _PLANREQUEST,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:PlanRequest)
-  })
-_sym_db.RegisterMessage(PlanRequest)
-_sym_db.RegisterMessage(PlanRequest.PlannerOptionsEntry)
-
-LogMessage = _reflection.GeneratedProtocolMessageType('LogMessage', (_message.Message,), {
-  'DESCRIPTOR' : _LOGMESSAGE,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:LogMessage)
-  })
-_sym_db.RegisterMessage(LogMessage)
-
-IntermediateReport = _reflection.GeneratedProtocolMessageType('IntermediateReport', (_message.Message,), {
-
-  'MetricsEntry' : _reflection.GeneratedProtocolMessageType('MetricsEntry', (_message.Message,), {
-    'DESCRIPTOR' : _INTERMEDIATEREPORT_METRICSENTRY,
-    '__module__' : 'upf_pb2'
-    # @@protoc_insertion_point(class_scope:IntermediateReport.MetricsEntry)
-    })
-  ,
-  'DESCRIPTOR' : _INTERMEDIATEREPORT,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:IntermediateReport)
-  })
-_sym_db.RegisterMessage(IntermediateReport)
-_sym_db.RegisterMessage(IntermediateReport.MetricsEntry)
-
-FinalReport = _reflection.GeneratedProtocolMessageType('FinalReport', (_message.Message,), {
-
-  'MetricsEntry' : _reflection.GeneratedProtocolMessageType('MetricsEntry', (_message.Message,), {
-    'DESCRIPTOR' : _FINALREPORT_METRICSENTRY,
-    '__module__' : 'upf_pb2'
-    # @@protoc_insertion_point(class_scope:FinalReport.MetricsEntry)
-    })
-  ,
-  'DESCRIPTOR' : _FINALREPORT,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:FinalReport)
-  })
-_sym_db.RegisterMessage(FinalReport)
-_sym_db.RegisterMessage(FinalReport.MetricsEntry)
-
-Answer = _reflection.GeneratedProtocolMessageType('Answer', (_message.Message,), {
-  'DESCRIPTOR' : _ANSWER,
-  '__module__' : 'upf_pb2'
-  # @@protoc_insertion_point(class_scope:Answer)
-  })
-_sym_db.RegisterMessage(Answer)
-
-
-_PLANREQUEST_PLANNEROPTIONSENTRY._options = None
-_INTERMEDIATEREPORT_METRICSENTRY._options = None
-_FINALREPORT_METRICSENTRY._options = None
-
-_UNIFIEDPLANNING = _descriptor.ServiceDescriptor(
-  name='UnifiedPlanning',
-  full_name='UnifiedPlanning',
-  file=DESCRIPTOR,
-  index=0,
-  serialized_options=None,
-  create_key=_descriptor._internal_create_key,
-  serialized_start=3360,
-  serialized_end=3417,
-  methods=[
-  _descriptor.MethodDescriptor(
-    name='planOneShot',
-    full_name='UnifiedPlanning.planOneShot',
-    index=0,
-    containing_service=None,
-    input_type=_PLANREQUEST,
-    output_type=_ANSWER,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-])
-_sym_db.RegisterServiceDescriptor(_UNIFIEDPLANNING)
-
-DESCRIPTOR.services_by_name['UnifiedPlanning'] = _UNIFIEDPLANNING
-
-# @@protoc_insertion_point(module_scope)
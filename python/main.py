@@ -3,73 +3,580 @@
 # license that can be found in the LICENSE file.
 import argparse
 import os
+import queue
+import threading
+import time
 from concurrent import futures
+from contextlib import contextmanager
 
 import grpc
 from upf.shortcuts import *
 
+import generated.upf_pb2 as upf_pb2
 import generated.upf_pb2_grpc as upf_pb2_grpc
+from admission import AdmissionQueue, problem_size
 from from_protobuf import FromProtobufConverter
+from metrics import MetricsInterceptor, ServerMetrics, serve_metrics
+from plan_cache import PlanCache
+from portfolio import Portfolio
+from problem_cache import (
+    BatchDomain,
+    BatchInstance,
+    ProblemCache,
+    ProblemDelta,
+    content_hash,
+)
+from singleflight import SingleFlight
+from solver_process import Base, SolverPool
 from to_protobuf import ToProtobufConverter
 
+
+def _parse_option(value):
+    for t in (int, float):
+        try:
+            return t(value)
+        except ValueError:
+            pass
+    return value
+
+
+# Without a deadline, gRPC reports a practically infinite remaining time, too
+# large to wait on.
+NO_DEADLINE = 1e9
+
+# Accept the keepalive pings of UpfGrpcClient channels, idle or not.
+KEEPALIVE_OPTIONS = [
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_ping_interval_without_data_ms", 10000),
+]
+
 EXPORT_BIN = None
 EXPORT_TEMPLATE = None
 MODE = None
 
 
 class UpfGrpcServer(upf_pb2_grpc.UpfServicer):
-    def __init__(self, port):
+    def __init__(
+        self,
+        port,
+        engine="tamer",
+        engine_params={"weight": 0.8},
+        plan_cache=None,
+        server_options=(),
+        anytime_params=None,
+        max_active=10,
+        max_queued=100,
+        portfolio=None,
+        metrics_port=None,
+    ):
         self.server = None
         self.port = port
-        self.from_protobuf = FromProtobufConverter()
-        self.to_protobuf = ToProtobufConverter()
+        # gRPC channel arguments for the server, e.g. ("grpc.so_reuseport", 1).
+        self.server_options = list(server_options)
+        self.engine = engine
+        self.engine_params = engine_params
+        # Parameter overrides tried in turn by `planOneShot` in OPTIMAL mode,
+        # after a first solve with the request parameters.
+        if anytime_params is None:
+            anytime_params = []
+            if engine == "tamer":
+                anytime_params = [{"weight": 0.65}, {"weight": 0.5}]
+        self.anytime_params = anytime_params
+        # Encoded answers, by content hash of the request they answer.
+        self.plans = plan_cache if plan_cache is not None else PlanCache()
+        # Problems registered with `registerProblem`, serialized, with their
+        # size. Solver processes decode and keep their own copies.
+        self.problems = ProblemCache()
+        # Requests served at once, and waiting in order of problem size.
+        self.admission = AdmissionQueue(max_active, max_queued)
+        # Requests being served, by content hash.
+        self.inflight = SingleFlight()
+        # Exported on http://127.0.0.1:<metrics_port>/metrics if set.
+        self.metrics = ServerMetrics()
+        self.metrics.registry.add_callback(self.stats)
+        self.metrics_port = metrics_port
+        self.metrics_server = None
+        # Solver processes, each keeping warm planner instances across
+        # requests, and killed to abort a solve.
+        self.solvers = SolverPool(max_size=max_active * len(portfolio or [None]))
+        # Plans the instances of `planBatch` streams, on behalf of the
+        # stream threads.
+        self.batch_executor = futures.ThreadPoolExecutor(max_workers=max_active)
+        # Engines raced by `plan` and `planDelta`, by name, with their
+        # parameters. If None, only `engine` is used.
+        self.portfolio = None
+        if portfolio:
+            self.portfolio = Portfolio(
+                portfolio, self.solvers, self.metrics.engine_runtime
+            )
 
     def plan(self, request, context):
-        problem = self.from_protobuf.convert(request)
+        key = content_hash(request)
+        cached = self.plans.get(key)
+        if cached is not None:
+            return upf_pb2.Answer.FromString(cached)
+        # Identical requests arriving together share one solve.
+        with self._status(context):
+            return self._single_flight(key, context, self._plan, key, request, context)
+
+    def _plan(self, key, request, context, size=None, base=None):
+        if size is None:
+            size = problem_size(request)
+        with self._admitted(size, context):
+            answer = self._solve(request.SerializeToString(), context, base)
+        self.plans.put(key, answer.SerializeToString())
+        return answer
+
+    def registerProblem(self, request, context):
+        key = content_hash(request)
+        if key not in self.problems:
+            self.problems.put(key, (request.SerializeToString(), problem_size(request)))
+        return upf_pb2.ProblemHandle(hash=key)
+
+    def planDelta(self, request, context):
+        registered = self.problems.get(request.hash)
+        if registered is None:
+            context.abort(
+                grpc.StatusCode.NOT_FOUND, "Unknown problem: %s" % request.hash
+            )
+        # The delta names the registered problem by hash, so it identifies
+        # the patched problem as well.
+        key = content_hash(request)
+        cached = self.plans.get(key)
+        if cached is not None:
+            return upf_pb2.Answer.FromString(cached)
+        # Only the delta goes to the solver processes, which decode the
+        # registered problem once and keep it.
+        problem, size = registered
+        base = Base(request.hash, problem, "ProblemDelta")
+        with self._status(context):
+            return self._single_flight(
+                key, context, self._plan, key, request, context, size, base
+            )
+
+    def planBatch(self, request_iterator, context):
+        first = next(request_iterator, None)
+        if first is None or not first.HasField("domain"):
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "A batch starts with its domain"
+            )
+        # Solver processes decode the domain once and keep it, each instance
+        # is sent to them as is.
+        domain = Base(
+            content_hash(first.domain),
+            first.domain.SerializeToString(),
+            "ProblemInstance",
+        )
+        size = problem_size(first.domain)
+
+        # Instances are read as they arrive and planned concurrently, at most
+        # `max_active` at a time per batch, their answers streamed back in
+        # completion order. The reader puts the number of instances last, or
+        # the error aborting the batch if a message is not an instance.
+        answers = queue.Queue()
+        pending = threading.Semaphore(self.admission.max_active)
+
+        def read():
+            n = 0
+            try:
+                for req in request_iterator:
+                    if not req.HasField("instance"):
+                        error = "Message %d of the batch is not an instance"
+                        answers.put(error % (n + 2))
+                        return
+                    pending.acquire()
+                    job = self.batch_executor.submit(
+                        self._plan_instance,
+                        domain,
+                        size,
+                        req.instance,
+                        context,
+                        answers,
+                    )
+                    job.add_done_callback(lambda _: pending.release())
+                    n += 1
+            finally:
+                answers.put(n)
+
+        threading.Thread(target=read, daemon=True).start()
+        done, total = 0, None
+        while total is None or done < total:
+            answer = answers.get()
+            if isinstance(answer, str):
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, answer)
+            if isinstance(answer, int):
+                total = answer
+                continue
+            done += 1
+            yield answer
+
+    def _plan_instance(self, domain, size, msg, context, answers):
+        try:
+            # Instances only make sense along with their domain, and their
+            # ids do not change their plan.
+            key = "%s:%s" % (domain.key, content_hash(msg.problem))
+            cached = self.plans.get(key)
+            if cached is not None:
+                answer = upf_pb2.Answer.FromString(cached)
+            else:
+                size += problem_size(msg.problem)
+                answer = self._single_flight(
+                    key, context, self._plan, key, msg, context, size, domain
+                )
+            answers.put(upf_pb2.BatchAnswer(id=msg.id, answer=answer))
+        except Exception as e:
+            answers.put(upf_pb2.BatchAnswer(id=msg.id, error=repr(e)))
+
+    def planOneShot(self, request, context):
+        with self._status(context):
+            with self._admitted(problem_size(request.problem), context):
+                yield from self._plan_one_shot(request, context)
+
+    def _plan_one_shot(self, request, context):
+        start = time.perf_counter()
+        deadline = self._deadline(context, request.timeout_seconds)
+        cancelled = self._cancellation(context)
+        problem = request.problem.SerializeToString()
+        params = dict(self.engine_params)
+        for k, v in request.planner_options.items():
+            params[k] = _parse_option(v)
+        schedule = [params]
+        if request.resolution_mode == upf_pb2.PlanRequest.OPTIMAL:
+            for p in self.anytime_params:
+                p = dict(params, **p)
+                if p not in schedule:
+                    schedule.append(p)
 
-        with OneshotPlanner(name="tamer", params={"weight": 0.8}) as planner:
-            plan = planner.solve(problem)
-            answer = self.to_protobuf.convert(plan)
+        final = upf_pb2.FinalReport(status=upf_pb2.FinalReport.SEARCH_SPACE_EXHAUSTED)
+        best = None
+        runs = 0
+        for p in schedule:
+            try:
+                answer = self._run_solver(problem, p, deadline, cancelled)
+            except TimeoutError as e:
+                if cancelled.is_set():
+                    return
+                # Keep the best plan found so far, if any.
+                final.status = upf_pb2.FinalReport.TIMEOUT
+                final.logs.add(level=upf_pb2.LogMessage.INFO, message=str(e))
+                break
+            except Exception as e:
+                final.status = upf_pb2.FinalReport.INTERNAL_ERROR
+                final.logs.add(level=upf_pb2.LogMessage.ERROR, message=repr(e))
+                break
+            runs += 1
+            if answer.status != 0:
+                # Later runs only change the search, not the problem.
+                break
+            length = len(answer.plan.actions)
+            if best is None or length < best:
+                best = length
+                report = upf_pb2.IntermediateReport(plan=answer)
+                report.metrics["time"] = "%f" % (time.perf_counter() - start)
+                report.metrics["plan_length"] = str(length)
+                report.logs.add(level=upf_pb2.LogMessage.INFO, message=str(p))
+                final.best_plan.CopyFrom(answer)
+                final.status = upf_pb2.FinalReport.SAT
+                yield upf_pb2.PlanUpdate(intermediate=report)
+
+        final.metrics["time"] = "%f" % (time.perf_counter() - start)
+        final.metrics["runs"] = str(runs)
+        if best is not None:
+            final.metrics["plan_length"] = str(best)
+        yield upf_pb2.PlanUpdate(final=final)
+
+    def _single_flight(self, key, context, f, *args):
+        """Returns f(*args), shared with the requests in flight for `key`"""
+        return self.inflight.do(
+            key,
+            f,
+            *args,
+            deadline=self._deadline(context),
+            cancelled=self._cancellation(context),
+        )
+
+    @contextmanager
+    def _status(self, context):
+        """Aborts the RPC with the status matching the errors of the block"""
+        try:
+            yield
+        except queue.Full as e:
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
+        except TimeoutError as e:
+            context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, str(e))
+
+    @contextmanager
+    def _admitted(self, size, context):
+        """Holds an admission slot, with priority to the smaller problems"""
+        start = time.perf_counter()
+        self.admission.acquire(
+            size, self._deadline(context), self._cancellation(context)
+        )
+        self.metrics.queue_wait.observe(time.perf_counter() - start)
+        try:
+            yield
+        finally:
+            self.admission.release()
+
+    def _deadline(self, context, timeout=0):
+        """time.monotonic() deadline from the RPC deadline and `timeout`"""
+        remaining = context.time_remaining()
+        if remaining is not None and remaining > NO_DEADLINE:
+            remaining = None
+        if timeout > 0 and (remaining is None or timeout < remaining):
+            remaining = timeout
+        return None if remaining is None else time.monotonic() + remaining
+
+    def _cancellation(self, context):
+        """Event set once the RPC terminates, e.g. when the client cancels it"""
+        done = threading.Event()
+        context.add_callback(done.set)
+        return done
+
+    def _run_solver(self, problem, params, deadline=None, cancelled=None, base=None):
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        timings = {}
+        with self.solvers.planner(timeout) as solver:
+            answer = solver.solve(
+                self.engine, params, problem, deadline, cancelled, timings, base
+            )
+        self._observe_phases(timings)
+        return upf_pb2.Answer.FromString(answer)
+
+    def _observe_phases(self, timings):
+        for phase, t in timings.items():
+            self.metrics.phases.observe(t, phase)
+
+    def _solve(self, problem, context, base=None):
+        deadline = self._deadline(context)
+        cancelled = self._cancellation(context)
+        if self.portfolio is not None:
+            timings = {}
+            answer = self.portfolio.solve(problem, deadline, cancelled, timings, base)
+            self._observe_phases(timings)
             return answer
-        return None
+        return self._run_solver(problem, self.engine_params, deadline, cancelled, base)
 
     def start(self):
-        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+        self.solvers.prefill(1)
+        # Queued requests hold a thread while they wait for admission, and
+        # `max_active` more threads answer cache hits and reject requests
+        # over capacity. RPCs are not capped beyond that: the admission queue
+        # rejects the requests over capacity, while duplicates of a request
+        # in flight wait for a thread to share its answer.
+        max_threads = 2 * self.admission.max_active + self.admission.max_queued
+        self.server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=max_threads),
+            interceptors=[MetricsInterceptor(self.metrics)],
+            options=KEEPALIVE_OPTIONS + self.server_options,
+        )
+        if self.metrics_port is not None:
+            registry = self.metrics.registry
+            self.metrics_server = serve_metrics(registry, self.metrics_port)
         upf_pb2_grpc.add_UpfServicer_to_server(self, self.server)
         self.server.add_insecure_port("0.0.0.0:%d" % self.port)
         self.server.start()
 
-    def wait_for_termination(self):
-        self.server.wait_for_termination()
+    def wait_for_termination(self, timeout=None):
+        """Returns True once the server stopped, False after `timeout`"""
+        if self.server.wait_for_termination(timeout):
+            return False
+        if self.metrics_server is not None:
+            self.metrics_server.shutdown()
+        if self.portfolio is not None:
+            self.portfolio.close()
+        self.batch_executor.shutdown(wait=False)
+        self.solvers.close()
+        return True
+
+    def stats(self):
+        stats = {
+            "plan_cache_hits": self.plans.hits,
+            "plan_cache_misses": self.plans.misses,
+            "plan_cache_entries": len(self.plans),
+            "registered_problems": len(self.problems),
+            "admitted": self.admission.admitted,
+            "rejected": self.admission.rejected,
+            "admission_timeouts": self.admission.timeouts,
+            "admission_cancellations": self.admission.cancellations,
+            "coalesced": self.inflight.coalesced,
+        }
+        if self.portfolio is not None:
+            for name, s in self.portfolio.stats().items():
+                for k, v in s.items():
+                    stats["portfolio_%s_%s" % (name, k)] = v
+        return stats
 
 
 class UpfGrpcClient:
-    def __init__(self, host, port):
+    """Client of a UpfGrpcServer, over one channel kept open across requests
+
+    The channel is opened on the first request, and pinged every
+    `keepalive_ms` milliseconds so that idle connections are not silently
+    dropped. Close it with `close`, or use the client as a context manager.
+
+    If `plan_cache` (a PlanCache) is given, answers to `__call__` and
+    `plan_delta` are cached by content hash of the request, and requests
+    already answered are served from it without any RPC.
+    """
+
+    def __init__(self, host, port, keepalive_ms=60000, plan_cache=None, **encoding):
+        # `encoding` holds the ToProtobufConverter options used for requests.
         self.host = host
         self.port = port
-        self.from_protobuf = FromProtobufConverter()
-        self.to_protobuf = ToProtobufConverter()
+        self.plans = plan_cache
+        self.encoding = encoding
+        self.channel_options = [
+            ("grpc.keepalive_time_ms", keepalive_ms),
+            ("grpc.keepalive_timeout_ms", 20000),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),
+        ]
+        self._channel = None
+        self._stub = None
+        self._lock = threading.Lock()
+
+    @property
+    def stub(self):
+        with self._lock:
+            if self._stub is None:
+                self._channel = grpc.insecure_channel(
+                    "%s:%d" % (self.host, self.port), options=self.channel_options
+                )
+                self._stub = upf_pb2_grpc.UpfStub(self._channel)
+            return self._stub
+
+    def close(self):
+        with self._lock:
+            if self._channel is not None:
+                self._channel.close()
+            self._channel = None
+            self._stub = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _encode(self, x):
+        # Converters keep per-conversion state, so that concurrent calls
+        # each get their own.
+        return ToProtobufConverter(**self.encoding).convert(x)
+
+    def _decode(self, answer, problem):
+        return FromProtobufConverter().convert(answer, problem)
 
     def __call__(self, problem):
-        with grpc.insecure_channel("%s:%d" % (self.host, self.port)) as channel:
-            stub = upf_pb2_grpc.UpfStub(channel)
-            req = self.to_protobuf.convert(problem)
+        req = self._encode(problem)
+
+        if EXPORT_TEMPLATE:
+            with open("data/UPF.md", "w") as f:
+                f.write("```bash\n" + str(req) + "```")
+
+        if EXPORT_BIN:
+            dir = f"data/bins/{MODE}"
+            if not os.path.exists(dir):
+                os.makedirs(dir)
+            with open(f"{dir}/{problem.name}.bin", "wb") as f:
+                f.write(req.SerializeToString())
+
+        answer = self._cached(req, self.stub.plan)
+
+        r = self._decode(answer, problem)
+        return r
+
+    def _cached(self, req, rpc):
+        if self.plans is None:
+            return rpc(req)
+        key = content_hash(req)
+        cached = self.plans.get(key)
+        if cached is not None:
+            return upf_pb2.Answer.FromString(cached)
+        answer = rpc(req)
+        self.plans.put(key, answer.SerializeToString())
+        return answer
+
+    def invalidate(self, problem=None):
+        """Drops the cached plan of `problem`, or every cached plan if None"""
+        if self.plans is None:
+            return
+        key = None
+        if problem is not None:
+            key = content_hash(self._encode(problem))
+        self.plans.invalidate(key)
+
+    def register(self, problem):
+        """Registers `problem` on the server and returns its content hash"""
+        req = self._encode(problem)
+        return self.stub.registerProblem(req).hash
+
+    def plan_delta(self, problem, problem_hash, initial_values={}, goals=()):
+        """Plans for the registered `problem` with changed initial values or goals
+
+        Raises grpc.RpcError with NOT_FOUND status if the server no longer knows
+        `problem_hash`, in which case the problem must be registered again.
+        """
+        em = problem.env.expression_manager
+        values = {}
+        for x, v in initial_values.items():
+            x, v = em.auto_promote(x, v)
+            values[x] = v
+        delta = ProblemDelta(problem_hash, values, em.auto_promote(*goals))
+        req = self._encode(delta)
+        answer = self._cached(req, self.stub.planDelta)
+        return self._decode(answer, problem)
+
+    def plan_batch(self, domain, problems, return_exceptions=False):
+        """Yields (index, plan) pairs for `problems` as their plans arrive
+
+        All problems share the fluents, objects and actions of the `domain`
+        problem, which are sent once for the whole batch. Each problem may
+        add objects of its own. If `return_exceptions` is True, the error of
+        a failed problem is yielded in place of its plan as a RuntimeError;
+        otherwise it is raised.
+        """
+        sent = {}
 
-            if EXPORT_TEMPLATE:
-                with open("data/UPF.md", "w") as f:
-                    f.write("```bash\n" + str(req) + "```")
+        def requests():
+            yield upf_pb2.BatchRequest(domain=self._encode(BatchDomain(domain)))
+            for i, problem in enumerate(problems):
+                sent[i] = problem
+                instance = BatchInstance(i, problem, domain)
+                yield upf_pb2.BatchRequest(instance=self._encode(instance))
 
-            if EXPORT_BIN:
-                dir = f"data/bins/{MODE}"
-                if not os.path.exists(dir):
-                    os.makedirs(dir)
-                with open(f"{dir}/{problem.name}.bin", "wb") as f:
-                    f.write(req.SerializeToString())
+        for answer in self.stub.planBatch(requests()):
+            problem = sent.pop(answer.id)
+            if answer.error:
+                error = RuntimeError(answer.error)
+                if not return_exceptions:
+                    raise error
+                yield answer.id, error
+            else:
+                yield answer.id, self._decode(answer.answer, problem)
 
-            answer = stub.plan(req)
+    def plan_one_shot(self, problem, optimal=False, timeout=0, planner_options={}):
+        """Yields each update of a planOneShot request, with its decoded plan
 
-            r = self.from_protobuf.convert(answer, problem)
-            return r
+        Updates are IntermediateReport messages, one per improved plan, then a
+        FinalReport. The plan is None for reports without a plan.
+        """
+        req = upf_pb2.PlanRequest(
+            problem=self._encode(problem),
+            timeout_seconds=timeout,
+            planner_options={k: str(v) for k, v in planner_options.items()},
+        )
+        if optimal:
+            req.resolution_mode = upf_pb2.PlanRequest.OPTIMAL
+        for update in self.stub.planOneShot(req):
+            if update.HasField("intermediate"):
+                report, answer = update.intermediate, update.intermediate.plan
+            else:
+                report, answer = update.final, update.final.best_plan
+            plan = None
+            if answer.status == 0 and answer.HasField("plan"):
+                plan = self._decode(answer, problem)
+            yield report, plan
 
 
 def main():
@@ -88,11 +595,42 @@ def main():
         action="store_true",
         help="export template to markdown files",
     )
+    parser.add_argument(
+        "--shared_expressions",
+        action="store_true",
+        help="send each distinct expression once and refer to it by index",
+    )
+    parser.add_argument(
+        "--packed_initial_state",
+        action="store_true",
+        help="send the initial state as columnar arrays",
+    )
+    parser.add_argument(
+        "--intern_symbols",
+        action="store_true",
+        help="send each name once in a string table (not read by the Rust server)",
+    )
+    parser.add_argument(
+        "--typed_payloads",
+        action="store_true",
+        help="send payloads in typed fields (not read by the Rust server)",
+    )
+    parser.add_argument(
+        "--plan_cache",
+        type=str,
+        default=None,
+        help="directory caching plans across runs",
+    )
     host = parser.parse_args().host
     port = parser.parse_args().port
     MODE = parser.parse_args().mode
     EXPORT_BIN = parser.parse_args().export_bin
     EXPORT_TEMPLATE = parser.parse_args().export_template
+    shared_expressions = parser.parse_args().shared_expressions
+    packed_initial_state = parser.parse_args().packed_initial_state
+    typed_payloads = parser.parse_args().typed_payloads
+    intern_symbols = parser.parse_args().intern_symbols
+    plan_cache = parser.parse_args().plan_cache
 
     if MODE == "basic":
         from basic_problems import get_example_problems
@@ -121,8 +659,17 @@ def main():
 
     # Start client
     print("\033[92m" + "Starting client..." + "\033[0m")
-    client = UpfGrpcClient(host=host, port=port)
-    plan = client(problem)
+    client = UpfGrpcClient(
+        host=host,
+        port=port,
+        shared_expressions=shared_expressions,
+        packed_initial_state=packed_initial_state,
+        typed_payloads=typed_payloads,
+        intern_symbols=intern_symbols,
+        plan_cache=PlanCache(path=plan_cache) if plan_cache else None,
+    )
+    with client:
+        plan = client(problem)
 
     # server.wait_for_termination()
 
@@ -0,0 +1,292 @@
+# Copyright 2022 Franklin Selva. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import bisect
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import grpc
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = tuple(4**i for i in range(3, 13))
+
+
+def _labels(names, values):
+    if not names:
+        return ""
+    pairs = ('%s="%s"' % (n, str(v).replace('"', '\\"')) for n, v in zip(names, values))
+    return "{" + ",".join(pairs) + "}"
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        # Label values -> value, or bucket counts and sum for histograms.
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _header(self):
+        name = self.name
+        return "# HELP %s %s\n# TYPE %s %s\n" % (name, self.help, name, self.kind)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labelvalues, amount=1):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def expose(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = (
+            "%s%s %s\n" % (self.name, _labels(self.labelnames, k), v) for k, v in values
+        )
+        return self._header() + "".join(lines)
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labelvalues, amount=1):
+        self.inc(*labelvalues, amount=-amount)
+
+    def set(self, value, *labelvalues):
+        with self._lock:
+            self._values[labelvalues] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, *labelvalues):
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(labelvalues)
+            if counts is None:
+                # One count per bucket, the +Inf bucket, then the sum.
+                counts = [0] * (len(self.buckets) + 1) + [0.0]
+                self._values[labelvalues] = counts
+            counts[i] += 1
+            counts[-1] += value
+
+    def expose(self):
+        with self._lock:
+            values = sorted((k, list(v)) for k, v in self._values.items())
+        lines = []
+        names = self.labelnames + ("le",)
+        for k, counts in values:
+            total = 0
+            for bound, n in zip(self.buckets + (math.inf,), counts):
+                total += n
+                le = "+Inf" if bound == math.inf else repr(bound)
+                lines.append(
+                    "%s_bucket%s %d\n" % (self.name, _labels(names, k + (le,)), total)
+                )
+            labels = _labels(self.labelnames, k)
+            lines.append("%s_sum%s %s\n" % (self.name, labels, counts[-1]))
+            lines.append("%s_count%s %d\n" % (self.name, labels, total))
+        return self._header() + "".join(lines)
+
+
+class Registry:
+    """Metrics exported together in the Prometheus text format
+
+    Besides metrics, callbacks returning a {name: number} dict are exported as
+    untyped values, read at scrape time.
+    """
+
+    def __init__(self, prefix=""):
+        self.prefix = prefix
+        self._metrics = []
+        self._callbacks = []
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, help, labelnames=()):
+        return self._add(Counter(self.prefix + name, help, labelnames))
+
+    def gauge(self, name, help, labelnames=()):
+        return self._add(Gauge(self.prefix + name, help, labelnames))
+
+    def histogram(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self._add(Histogram(self.prefix + name, help, labelnames, buckets))
+
+    def add_callback(self, f):
+        self._callbacks.append(f)
+
+    def expose(self):
+        text = [m.expose() for m in self._metrics]
+        for f in self._callbacks:
+            for k, v in sorted(f().items()):
+                text.append("%s%s %s\n" % (self.prefix, k, v))
+        return "".join(text)
+
+
+class ServerMetrics:
+    """Metrics of a UpfGrpcServer, by RPC method"""
+
+    def __init__(self, registry=None):
+        r = self.registry = registry or Registry("upf_")
+        self.requests = r.counter("requests_total", "RPCs received.", ["method"])
+        self.errors = r.counter(
+            "errors_total", "RPCs failed, by status code.", ["method", "code"]
+        )
+        self.in_flight = r.gauge("in_flight", "RPCs being served.", ["method"])
+        self.latency = r.histogram(
+            "request_seconds", "Time to serve an RPC.", ["method"]
+        )
+        self.request_bytes = r.histogram(
+            "request_bytes", "Size of request messages.", ["method"], SIZE_BUCKETS
+        )
+        self.response_bytes = r.histogram(
+            "response_bytes", "Size of response messages.", ["method"], SIZE_BUCKETS
+        )
+        self.queue_wait = r.histogram(
+            "queue_wait_seconds", "Time waiting for admission."
+        )
+        self.phases = r.histogram(
+            "phase_seconds",
+            "Time spent decoding, solving and encoding problems.",
+            ["phase"],
+        )
+        self.engine_runtime = r.histogram(
+            "engine_seconds",
+            "Time portfolio engines took to finish a solve.",
+            ["engine"],
+        )
+
+
+class MetricsInterceptor(grpc.ServerInterceptor):
+    """Records the request, error, latency and size metrics of every RPC
+
+    Message sizes are taken from the serialized bytes, through the method
+    deserializer and serializer, so they cost no extra serialization.
+    """
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    def _measured_deserializer(self, f, method):
+        if f is None:
+            return None
+
+        def deserialize(data):
+            self.metrics.request_bytes.observe(len(data), method)
+            return f(data)
+
+        return deserialize
+
+    def _measured_serializer(self, f, method):
+        if f is None:
+            return None
+
+        def serialize(x):
+            data = f(x)
+            self.metrics.response_bytes.observe(len(data), method)
+            return data
+
+        return serialize
+
+    def _failed(self, method, context):
+        code = context.code() if hasattr(context, "code") else None
+        self.metrics.errors.inc(method, (code or grpc.StatusCode.UNKNOWN).name)
+
+    def _unary(self, behavior, method):
+        m = self.metrics
+
+        def wrapper(request, context):
+            start = time.perf_counter()
+            m.requests.inc(method)
+            m.in_flight.inc(method)
+            try:
+                return behavior(request, context)
+            except Exception:
+                self._failed(method, context)
+                raise
+            finally:
+                m.in_flight.dec(method)
+                m.latency.observe(time.perf_counter() - start, method)
+
+        return wrapper
+
+    def _streaming(self, behavior, method):
+        m = self.metrics
+
+        def wrapper(request, context):
+            start = time.perf_counter()
+            m.requests.inc(method)
+            m.in_flight.inc(method)
+            try:
+                yield from behavior(request, context)
+            except Exception:
+                self._failed(method, context)
+                raise
+            finally:
+                m.in_flight.dec(method)
+                m.latency.observe(time.perf_counter() - start, method)
+
+        return wrapper
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+        if handler.unary_unary:
+            kind, behavior = "unary_unary", self._unary(handler.unary_unary, method)
+        elif handler.stream_unary:
+            kind, behavior = "stream_unary", self._unary(handler.stream_unary, method)
+        elif handler.unary_stream:
+            kind, behavior = "unary_stream", self._streaming(
+                handler.unary_stream, method
+            )
+        else:
+            kind, behavior = "stream_stream", self._streaming(
+                handler.stream_stream, method
+            )
+        return getattr(grpc, kind + "_rpc_method_handler")(
+            behavior,
+            request_deserializer=self._measured_deserializer(
+                handler.request_deserializer, method
+            ),
+            response_serializer=self._measured_serializer(
+                handler.response_serializer, method
+            ),
+        )
+
+
+def serve_metrics(registry, port, host="127.0.0.1"):
+    """Serves `registry` on http://host:port/metrics from a daemon thread"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.expose().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
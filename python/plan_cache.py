@@ -0,0 +1,155 @@
+# Copyright 2022 Franklin Selva. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class PlanCache:
+    """Encoded answers by problem content hash, with LRU and TTL eviction
+
+    Entries are kept in memory, bounded by `max_entries` and `max_bytes`, and
+    expire `ttl` seconds after they were stored (never if `ttl` is None). If
+    `path` is given, entries are also written to a sqlite database in that
+    directory, so that the cache survives restarts. Hits only record their
+    time in memory, and are written along with the next `put` or on `close`,
+    to keep disk writes off the lookup path.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=64 << 20, ttl=None, path=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> (answer bytes, time stored), least recently used first.
+        self._entries = OrderedDict()
+        self._size = 0
+        # key -> time of the last hit, not yet written to the database.
+        self._used = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+            self._db = sqlite3.connect(
+                os.path.join(path, "plans.sqlite"), check_same_thread=False
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS plans "
+                "(key TEXT PRIMARY KEY, answer BLOB, stored REAL, used REAL)"
+            )
+            self._db.commit()
+            self._load()
+
+    def _load(self):
+        rows = self._db.execute(
+            "SELECT key, answer, stored FROM plans ORDER BY used DESC LIMIT ?",
+            (self.max_entries,),
+        ).fetchall()
+        for key, answer, stored in reversed(rows):
+            if not self._expired(stored, time.time()):
+                self._put(key, bytes(answer), stored)
+        self._evict()
+
+    def _expired(self, stored, now):
+        return self.ttl is not None and now - stored > self.ttl
+
+    def _put(self, key, answer, stored):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old[0])
+        self._entries[key] = (answer, stored)
+        self._size += len(answer)
+
+    def _evict(self):
+        evicted = []
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._size > self.max_bytes
+        ):
+            key, (answer, _) = self._entries.popitem(last=False)
+            self._size -= len(answer)
+            evicted.append(key)
+        self.evictions += len(evicted)
+        return evicted
+
+    def _flush_used(self):
+        if self._used:
+            self._db.executemany(
+                "UPDATE plans SET used = ? WHERE key = ?",
+                [(t, k) for k, t in self._used.items()],
+            )
+            self._used = {}
+
+    def _remove(self, keys):
+        if self._db is not None and keys:
+            self._db.executemany(
+                "DELETE FROM plans WHERE key = ?", [(k,) for k in keys]
+            )
+            self._db.commit()
+
+    def get(self, key):
+        """Returns the serialized answer stored for `key`, or None"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[1], now):
+                self._size -= len(entry[0])
+                del self._entries[key]
+                self._remove([key])
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            if self._db is not None:
+                self._used[key] = now
+            return entry[0]
+
+    def put(self, key, answer):
+        """Stores the serialized answer `answer` for `key`"""
+        now = time.time()
+        with self._lock:
+            self._put(key, answer, now)
+            evicted = self._evict()
+            if self._db is not None:
+                self._used.pop(key, None)
+                self._flush_used()
+                self._db.execute(
+                    "INSERT OR REPLACE INTO plans VALUES (?, ?, ?, ?)",
+                    (key, answer, now, now),
+                )
+                self._remove(evicted)
+                self._db.commit()
+
+    def invalidate(self, key=None):
+        """Removes the entry for `key`, or every entry if `key` is None"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._size = 0
+                self._used = {}
+                if self._db is not None:
+                    self._db.execute("DELETE FROM plans")
+                    self._db.commit()
+            else:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._size -= len(entry[0])
+                self._remove([key])
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._flush_used()
+                self._db.commit()
+                self._db.close()
+                self._db = None
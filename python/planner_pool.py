@@ -0,0 +1,172 @@
+# Copyright 2022 Franklin Selva. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import threading
+import time
+from contextlib import contextmanager
+
+from upf.shortcuts import OneshotPlanner
+
+
+class PlannerPool:
+    """Pre-constructed planner engines sharing one (name, params) configuration
+
+    Planners are checked out for one solve at a time and checked back in
+    afterwards. At most `max_size` planners exist at once, and planners that
+    stayed idle for more than `max_idle` seconds are destroyed.
+    """
+
+    def __init__(
+        self, name, params=None, max_size=4, max_idle=300.0, health_check=None
+    ):
+        self.name = name
+        self.params = dict(params or {})
+        self.max_size = max_size
+        self.max_idle = max_idle
+        # Optional predicate checked before an idle planner is handed out,
+        # e.g. whether the process behind it is still alive. In-process
+        # planners offer nothing to probe, so they are not checked.
+        self.health_check = health_check
+        # Idle planners with the time they were checked in, most recent last.
+        self._idle = []
+        self._size = 0
+        self._cond = threading.Condition()
+
+    def _create(self):
+        return OneshotPlanner(name=self.name, params=self.params)
+
+    def _destroy(self, planner):
+        try:
+            planner.destroy()
+        except Exception:
+            pass
+
+    def _pop_expired(self):
+        deadline = time.monotonic() - self.max_idle
+        expired = [p for p, t in self._idle if t < deadline]
+        if expired:
+            self._idle = [(p, t) for p, t in self._idle if t >= deadline]
+            self._size -= len(expired)
+        return expired
+
+    def prefill(self, n=None):
+        """Creates planners until `n` (default: `max_size`) of them exist"""
+        n = self.max_size if n is None else min(n, self.max_size)
+        while True:
+            with self._cond:
+                if self._size >= n:
+                    return
+                self._size += 1
+            self.checkin(self._new_planner())
+
+    def _new_planner(self):
+        try:
+            return self._create()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+    def checkout(self, timeout=None):
+        """Returns an idle healthy planner, creating one if the pool is not full
+
+        Raises TimeoutError if no planner became available within `timeout`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        unhealthy = []
+        try:
+            with self._cond:
+                unhealthy.extend(self._pop_expired())
+                while True:
+                    while self._idle:
+                        planner, _ = self._idle.pop()
+                        if self.health_check is None or self.health_check(planner):
+                            return planner
+                        self._size -= 1
+                        unhealthy.append(planner)
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining = None
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise TimeoutError("No %s planner available" % self.name)
+                    self._cond.wait(remaining)
+        finally:
+            for planner in unhealthy:
+                self._destroy(planner)
+        return self._new_planner()
+
+    def checkin(self, planner, healthy=True):
+        with self._cond:
+            if healthy:
+                self._idle.append((planner, time.monotonic()))
+                expired = self._pop_expired()
+            else:
+                self._size -= 1
+                expired = [planner]
+            self._cond.notify()
+        for p in expired:
+            self._destroy(p)
+
+    @contextmanager
+    def planner(self, timeout=None):
+        """Checks out a planner for the duration of the block
+
+        The planner is discarded instead of returned to the pool if the block
+        raises, unless the planner survives the error, see `_survives`.
+        """
+        planner = self.checkout(timeout)
+        healthy = False
+        try:
+            yield planner
+            healthy = True
+        except Exception as e:
+            healthy = self._survives(planner, e)
+            raise
+        finally:
+            self.checkin(planner, healthy)
+
+    def _survives(self, planner, error):
+        # A failed solve may leave an in-process planner in any state.
+        return False
+
+    def evict_idle(self):
+        with self._cond:
+            expired = self._pop_expired()
+        for planner in expired:
+            self._destroy(planner)
+
+    def close(self):
+        with self._cond:
+            idle = [p for p, _ in self._idle]
+            self._idle = []
+            self._size -= len(idle)
+        for planner in idle:
+            self._destroy(planner)
+
+
+class PlannerPools:
+    """One PlannerPool per (engine name, params) key, created on first use"""
+
+    def __init__(self, **pool_options):
+        self.pool_options = pool_options
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def get(self, name, params=None):
+        key = (name, tuple(sorted((params or {}).items())))
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = PlannerPool(name, params, **self.pool_options)
+            return pool
+
+    def close(self):
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools = {}
+        for pool in pools:
+            pool.close()
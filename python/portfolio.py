@@ -0,0 +1,118 @@
+# Copyright 2022 Franklin Selva. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import threading
+import time
+from concurrent import futures
+
+import generated.upf_pb2 as upf_pb2
+
+
+class _Stop:
+    # Cancellation of the racers of one solve: set once an engine won, or
+    # when the caller cancels.
+    def __init__(self, cancelled):
+        self.won = threading.Event()
+        self.cancelled = cancelled
+
+    def is_set(self):
+        return self.won.is_set() or (
+            self.cancelled is not None and self.cancelled.is_set()
+        )
+
+
+class Portfolio:
+    """Races several engines on each problem, in separate solver processes
+
+    `engines` maps engine names to their parameters. Every solve runs all of
+    them at once, each in a process of `solvers` (a SolverPool), returns the
+    first plan found and kills the other solves. Per engine races, wins and
+    runtimes are recorded to tune the portfolio, the runtimes also in the
+    `runtimes` Histogram, labelled by engine, if given.
+    """
+
+    def __init__(self, engines, solvers, runtimes=None):
+        self.engines = dict(engines)
+        self.solvers = solvers
+        self.runtimes = runtimes
+        # Every racer holds a thread while waiting for its solver process.
+        self._executor = futures.ThreadPoolExecutor(max_workers=solvers.max_size)
+        self._lock = threading.Lock()
+        self._stats = {
+            name: dict(races=0, finished=0, wins=0, plans=0, errors=0, time=0.0)
+            for name in self.engines
+        }
+
+    def _record(self, name, **counts):
+        with self._lock:
+            stats = self._stats[name]
+            for k, v in counts.items():
+                stats[k] += v
+
+    def _race(self, name, params, request, deadline, stop, timings, base):
+        self._record(name, races=1)
+        start = time.perf_counter()
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            with self.solvers.planner(timeout) as solver:
+                answer = solver.solve(
+                    name, params, request, deadline, stop, timings, base
+                )
+        except TimeoutError:
+            # Lost the race, or cancelled: no runtime to record.
+            raise
+        except Exception:
+            self._record(name, errors=1)
+            raise
+        answer = upf_pb2.Answer.FromString(answer)
+        elapsed = time.perf_counter() - start
+        self._record(name, finished=1, plans=int(answer.status == 0), time=elapsed)
+        if self.runtimes is not None:
+            self.runtimes.observe(elapsed, name)
+        return answer
+
+    def solve(self, request, deadline=None, cancelled=None, timings=None, base=None):
+        """Returns the first Answer with a plan to the serialized `request`
+
+        If no engine finds a plan, returns the last Answer without one, or
+        raises the error of the last engine if all of them failed. Raises
+        TimeoutError, and updates `timings`, as SolverProcess.solve does,
+        which also describes `base`.
+        """
+        stop = _Stop(cancelled)
+        phases = {name: {} for name in self.engines}
+        racers = {
+            self._executor.submit(
+                self._race, name, params, request, deadline, stop, phases[name], base
+            ): name
+            for name, params in self.engines.items()
+        }
+        answer = error = None
+        for f in futures.as_completed(racers):
+            try:
+                result = f.result()
+            except Exception as e:
+                error = e
+                continue
+            answer = result
+            if timings is not None:
+                timings.update(phases[racers[f]])
+            if result.status == 0:
+                stop.won.set()
+                self._record(racers[f], wins=1)
+                return result
+        if answer is None:
+            raise error
+        return answer
+
+    def stats(self):
+        """Per engine counters, win rate and mean runtime of finished solves"""
+        with self._lock:
+            stats = {name: dict(s) for name, s in self._stats.items()}
+        for s in stats.values():
+            s["win_rate"] = s["wins"] / s["races"] if s["races"] else 0.0
+            s["mean_time"] = s["time"] / s["finished"] if s["finished"] else 0.0
+        return stats
+
+    def close(self):
+        self._executor.shutdown(wait=False)
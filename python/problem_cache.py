@@ -0,0 +1,52 @@
+# Copyright 2022 Franklin Selva. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+
+# Changes to a registered problem: `initial_values` maps fluent expressions to
+# their new value, and `goals`, if not empty, replaces the problem goals.
+ProblemDelta = namedtuple("ProblemDelta", ["hash", "initial_values", "goals"])
+
+# Problems of a planBatch stream. The domain is a problem whose fluents, objects
+# and actions are shared by all instances, and is sent without its initial
+# state and goals. Each instance is sent as its differences to the domain.
+BatchDomain = namedtuple("BatchDomain", ["problem"])
+BatchInstance = namedtuple("BatchInstance", ["id", "problem", "domain"])
+
+
+def content_hash(msg):
+    """Hash of the deterministic serialization of a protobuf message"""
+    return hashlib.sha256(msg.SerializeToString(deterministic=True)).hexdigest()
+
+
+class ProblemCache:
+    """Problems by content hash, with LRU eviction"""
+
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self._problems = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            problem = self._problems.get(key)
+            if problem is not None:
+                self._problems.move_to_end(key)
+            return problem
+
+    def put(self, key, problem):
+        with self._lock:
+            self._problems[key] = problem
+            self._problems.move_to_end(key)
+            while len(self._problems) > self.max_size:
+                self._problems.popitem(last=False)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._problems
+
+    def __len__(self):
+        with self._lock:
+            return len(self._problems)
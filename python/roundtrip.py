@@ -0,0 +1,70 @@
+# Copyright 2022 Franklin Selva. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import argparse
+import itertools
+import sys
+
+from from_protobuf import FromProtobufConverter
+from to_protobuf import ToProtobufConverter
+
+ENCODING_OPTIONS = (
+    "shared_expressions",
+    "intern_symbols",
+    "packed_initial_state",
+    "typed_payloads",
+)
+
+
+def _initial_state(problem):
+    return {str(x): str(v) for x, v in problem.initial_values().items()}
+
+
+def check_roundtrip(problem, **encoding):
+    """Returns the differences between `problem` and its decoded encoding"""
+    msg = ToProtobufConverter(**encoding).convert(problem)
+    decoded = FromProtobufConverter().convert(msg)
+
+    errors = []
+    expected = _initial_state(problem)
+    actual = _initial_state(decoded)
+    for x in sorted(expected.keys() | actual.keys()):
+        if expected.get(x) != actual.get(x):
+            errors.append(
+                "initial value of %s: %s != %s" % (x, expected.get(x), actual.get(x))
+            )
+    if [str(g) for g in problem.goals()] != [str(g) for g in decoded.goals()]:
+        errors.append("goals differ")
+    if [a.name for a in problem.actions()] != [a.name for a in decoded.actions()]:
+        errors.append("actions differ")
+    return errors
+
+
+def main():
+    """Checks that the example problems survive a protobuf round-trip"""
+    parser = argparse.ArgumentParser(description="UPF protobuf round-trip check.")
+    parser.add_argument("--mode", type=str, default="basic", help="basic or advanced")
+    mode = parser.parse_args().mode
+
+    if mode == "basic":
+        from basic_problems import get_example_problems
+    else:
+        from problems import get_example_problems
+
+    failed = []
+    for name, example in get_example_problems().items():
+        for flags in itertools.product((False, True), repeat=len(ENCODING_OPTIONS)):
+            encoding = dict(zip(ENCODING_OPTIONS, flags))
+            errors = check_roundtrip(example.problem, **encoding)
+            if errors:
+                failed.append(name)
+                print("\033[91m" + "%s %s" % (name, encoding) + "\033[0m")
+                for e in errors:
+                    print("  " + e)
+        if name not in failed:
+            print("\033[92m" + name + "\033[0m")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
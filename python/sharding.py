@@ -0,0 +1,199 @@
+# Copyright 2022 Franklin Selva. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import argparse
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import time
+
+
+def _serve(index, port, stats, stats_interval, server_args):
+    # Imported here so that no gRPC state exists in the supervisor when it
+    # forks workers.
+    from main import UpfGrpcServer
+
+    server = UpfGrpcServer(
+        port, server_options=[("grpc.so_reuseport", 1)], **server_args
+    )
+    # Stopping the server lets it close its solver processes.
+    signal.signal(signal.SIGTERM, lambda *_: server.server.stop(None))
+    server.start()
+    while not server.wait_for_termination(stats_interval):
+        stats.put((index, os.getpid(), server.stats()))
+
+
+class ShardedServer:
+    """Runs `workers` UpfGrpcServer processes listening on the same port
+
+    Every worker binds `port` with SO_REUSEPORT, and the kernel spreads
+    incoming connections across them. The supervisor restarts workers that
+    exit, waiting at least `restart_delay` seconds between restarts of the
+    same worker, and collects the stats each worker reports every
+    `stats_interval` seconds.
+
+    Workers are not daemon processes, as they start solver processes of their
+    own, so `stop` must be called to end them.
+    """
+
+    def __init__(
+        self, port, workers=None, stats_interval=5.0, restart_delay=1.0, **server_args
+    ):
+        self.port = port
+        self.workers = workers or os.cpu_count()
+        self.stats_interval = stats_interval
+        self.restart_delay = restart_delay
+        self.server_args = server_args
+        self.restarts = 0
+        self._context = multiprocessing.get_context("fork")
+        self._stats = self._context.Queue()
+        self._processes = [None] * self.workers
+        self._started = [0.0] * self.workers
+        # Latest stats reported by each worker, by worker index.
+        self._worker_stats = {}
+        self._running = False
+
+    def _spawn(self, index):
+        p = self._context.Process(
+            target=_serve,
+            args=(index, self.port, self._stats, self.stats_interval, self.server_args),
+            name="upf-worker-%d" % index,
+        )
+        p.start()
+        self._processes[index] = p
+        self._started[index] = time.monotonic()
+
+    def start(self):
+        self._running = True
+        for i in range(self.workers):
+            self._spawn(i)
+
+    def _collect(self, timeout):
+        try:
+            index, pid, stats = self._stats.get(timeout=timeout)
+        except queue.Empty:
+            return
+        self._worker_stats[index] = dict(stats, pid=pid)
+        while True:
+            try:
+                index, pid, stats = self._stats.get_nowait()
+            except queue.Empty:
+                return
+            self._worker_stats[index] = dict(stats, pid=pid)
+
+    def _restart_dead(self):
+        for i, p in enumerate(self._processes):
+            if p.is_alive():
+                continue
+            if time.monotonic() - self._started[i] < self.restart_delay:
+                continue
+            print(
+                "\033[91m"
+                + "Worker %d (pid %d) exited with %s, restarting"
+                % (i, p.pid, p.exitcode)
+                + "\033[0m"
+            )
+            self._worker_stats.pop(i, None)
+            self.restarts += 1
+            self._spawn(i)
+
+    def supervise(self, poll_interval=0.5):
+        """Restarts crashed workers and collects stats until `stop`"""
+        while self._running:
+            self._collect(poll_interval)
+            self._restart_dead()
+
+    def stats(self):
+        """Sums of the stats last reported by the workers"""
+        total = {"workers": len(self._worker_stats), "restarts": self.restarts}
+        for stats in self._worker_stats.values():
+            for k, v in stats.items():
+                if k != "pid":
+                    total[k] = total.get(k, 0) + v
+        # Ratios are taken again over the summed portfolio counters.
+        for k in total:
+            if k.endswith("_win_rate"):
+                prefix = k[: -len("win_rate")]
+                races = total[prefix + "races"]
+                total[k] = total[prefix + "wins"] / races if races else 0.0
+            elif k.endswith("_mean_time"):
+                prefix = k[: -len("mean_time")]
+                finished = total[prefix + "finished"]
+                total[k] = total[prefix + "time"] / finished if finished else 0.0
+        return total
+
+    def worker_stats(self):
+        return dict(self._worker_stats)
+
+    def stop(self, timeout=5.0):
+        self._running = False
+        for p in self._processes:
+            if p is not None and p.is_alive():
+                p.terminate()
+        deadline = time.monotonic() + timeout
+        for p in self._processes:
+            if p is not None:
+                p.join(max(0.0, deadline - time.monotonic()))
+                if p.is_alive():
+                    p.kill()
+                    p.join()
+
+
+def check(port, workers=2, timeout=30.0):
+    """Starts a ShardedServer and returns the status of a `plan` it answers"""
+    server = ShardedServer(port, workers)
+    server.start()
+    try:
+        import grpc
+
+        import generated.upf_pb2_grpc as upf_pb2_grpc
+        from basic_problems import get_example_problems
+        from to_protobuf import ToProtobufConverter
+
+        problem = next(iter(get_example_problems().values())).problem
+        request = ToProtobufConverter().convert(problem)
+        with grpc.insecure_channel("127.0.0.1:%d" % port) as channel:
+            # Waits for a worker to listen on the port.
+            grpc.channel_ready_future(channel).result(timeout)
+            stub = upf_pb2_grpc.UpfStub(channel)
+            return stub.plan(request, timeout=timeout).status
+    finally:
+        server.stop()
+
+
+def main():
+    """Runs several planning server processes on one port"""
+    parser = argparse.ArgumentParser(description="Sharded UPF planning server.")
+    parser.add_argument("--port", type=int, default=2222, help="port")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="server processes (default: cores)"
+    )
+    parser.add_argument(
+        "--stats_interval", type=float, default=5.0, help="seconds between stats"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="check that a worker answers a plan"
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        status = check(args.port, args.workers or 2)
+        print("\033[92m" + "Worker answered with status %d" % status + "\033[0m")
+        sys.exit(0)
+
+    server = ShardedServer(args.port, args.workers, args.stats_interval)
+    server.start()
+    print("\033[92m" + "Started %d workers" % server.workers + "\033[0m")
+    try:
+        server.supervise()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(server.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Copyright 2022 Franklin Selva. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import threading
+import time
+from concurrent import futures
+
+# How often a waiting caller checks for its deadline and cancellation.
+POLL_INTERVAL = 0.05
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time, shared by concurrent callers
+
+    Callers arriving while the call for their key is in flight wait for it and
+    get its result, or its exception. TimeoutError is the exception: it
+    reflects the deadline or cancellation of the caller that made the call, so
+    waiting callers make the call again instead. Waiting callers give up on
+    their own deadline or cancellation, without affecting the call.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        # key -> Future of the call in flight.
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, f, *args, deadline=None, cancelled=None):
+        """Returns f(*args), or the result of the call in flight for `key`
+
+        `deadline` is a time.monotonic() value, and `cancelled` a
+        threading.Event. If either is reached while waiting for the call in
+        flight, TimeoutError is raised.
+        """
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                if future is None:
+                    future = self._calls[key] = futures.Future()
+                    self.calls += 1
+                    break
+                self.coalesced += 1
+            self._wait(future, deadline, cancelled)
+            try:
+                return future.result()
+            except TimeoutError:
+                pass
+        try:
+            result = f(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def _wait(self, future, deadline, cancelled):
+        while True:
+            timeout = POLL_INTERVAL
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    raise TimeoutError("Planning timed out")
+            if cancelled is not None and cancelled.is_set():
+                raise TimeoutError("Planning cancelled")
+            done, _ = futures.wait([future], timeout)
+            if done:
+                return
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,174 @@
+# Copyright 2022 Franklin Selva. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+import multiprocessing
+import time
+from collections import namedtuple
+
+import generated.upf_pb2 as upf_pb2
+from from_protobuf import FromProtobufConverter
+from planner_pool import PlannerPool, PlannerPools
+from problem_cache import ProblemCache
+from to_protobuf import ToProtobufConverter
+
+# Solver processes are forked from a server process started before any gRPC
+# thread exists, with the converters and planners already imported.
+multiprocessing.set_forkserver_preload([__name__])
+
+# How often a waiting solve checks for its deadline and cancellation.
+POLL_INTERVAL = 0.05
+
+# Problems each solver process keeps decoded, by content hash.
+MAX_PROBLEMS = 64
+
+# Problem that a request of type `request_type`, the name of a upf_pb2
+# message such as "ProblemDelta", applies to: its content hash `key`, and
+# the serialized Problem, left out when the process is expected to know it.
+Base = namedtuple("Base", ["key", "problem", "request_type"])
+
+
+def _decode(problems, request, base):
+    # Returns None if the base problem is neither known nor sent.
+    if base is None:
+        return FromProtobufConverter().convert(upf_pb2.Problem.FromString(request))
+    problem = problems.get(base.key)
+    if problem is None:
+        if base.problem is None:
+            return None
+        msg = upf_pb2.Problem.FromString(base.problem)
+        problem = FromProtobufConverter().convert(msg)
+        problems.put(base.key, problem)
+    msg = getattr(upf_pb2, base.request_type).FromString(request)
+    return FromProtobufConverter().convert(msg, problem)
+
+
+def _serve(conn):
+    planners = PlannerPools(max_size=1)
+    problems = ProblemCache(max_size=MAX_PROBLEMS)
+    while True:
+        try:
+            engine, params, request, base = conn.recv()
+        except EOFError:
+            break
+        try:
+            start = time.perf_counter()
+            problem = _decode(problems, request, base)
+            if problem is None:
+                conn.send((None, None, {}))
+                continue
+            decoded = time.perf_counter()
+            with planners.get(engine, params).planner() as planner:
+                plan = planner.solve(problem)
+            solved = time.perf_counter()
+            answer = ToProtobufConverter().convert(plan).SerializeToString()
+            timings = {
+                "decode": decoded - start,
+                "solve": solved - decoded,
+                "encode": time.perf_counter() - solved,
+            }
+            conn.send((True, answer, timings))
+        except Exception as e:
+            conn.send((False, repr(e), {}))
+    planners.close()
+
+
+class SolverProcess:
+    """Child process solving serialized problems one at a time
+
+    The process keeps its planners warm between solves, and is killed when a
+    solve outlives its deadline or gets cancelled, as planners offer no way to
+    interrupt a search.
+    """
+
+    def __init__(self):
+        context = multiprocessing.get_context("forkserver")
+        self._conn, child = context.Pipe()
+        self._process = context.Process(target=_serve, args=(child,), daemon=True)
+        self._process.start()
+        child.close()
+
+    def is_alive(self):
+        return self._process.is_alive()
+
+    def solve(
+        self,
+        engine,
+        params,
+        request,
+        deadline=None,
+        cancelled=None,
+        timings=None,
+        base=None,
+    ):
+        """Returns the serialized Answer to the serialized Problem `request`
+
+        If `base` (a Base) is given, `request` is rather a serialized message
+        of type `base.request_type` applied to that problem. The process
+        keeps the problems it decoded, so `base.problem` is only sent to it
+        the first time.
+
+        `deadline` is a time.monotonic() value, and `cancelled` a
+        threading.Event. If either is reached first, the process is killed and
+        TimeoutError is raised. Planner errors are raised as RuntimeError.
+        If given, the `timings` dict is updated with the time the process
+        spent decoding, solving and encoding.
+        """
+        known = None if base is None else base._replace(problem=None)
+        self._conn.send((engine, params, request, known))
+        ok, result, phases = self._receive(deadline, cancelled)
+        if ok is None:
+            self._conn.send((engine, params, request, base))
+            ok, result, phases = self._receive(deadline, cancelled)
+        if not ok:
+            raise RuntimeError(result)
+        if timings is not None:
+            timings.update(phases)
+        return result
+
+    def _receive(self, deadline, cancelled):
+        while True:
+            timeout = POLL_INTERVAL
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    self.close()
+                    raise TimeoutError("Planning timed out")
+            if cancelled is not None and cancelled.is_set():
+                self.close()
+                raise TimeoutError("Planning cancelled")
+            if self._conn.poll(timeout):
+                break
+        try:
+            return self._conn.recv()
+        except EOFError:
+            self.close()
+            raise RuntimeError("Solver process exited with %s" % self._process.exitcode)
+
+    def close(self):
+        self._conn.close()
+        if self._process.is_alive():
+            self._process.kill()
+        self._process.join()
+
+
+class SolverPool(PlannerPool):
+    """PlannerPool of SolverProcess instances, for any engine"""
+
+    def __init__(self, max_size=4, max_idle=300.0):
+        super().__init__(
+            "solver",
+            max_size=max_size,
+            max_idle=max_idle,
+            health_check=SolverProcess.is_alive,
+        )
+
+    def _create(self):
+        return SolverProcess()
+
+    def _destroy(self, solver):
+        solver.close()
+
+    def _survives(self, solver, error):
+        # Planner errors are reported by a process that is ready for the next
+        # solve, while timeouts and lost processes already closed it.
+        return not isinstance(error, TimeoutError) and solver.is_alive()
@@ -12,56 +12,287 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import numbers
+from contextlib import contextmanager
+from fractions import Fraction
+
+import numpy as np
 import upf.model
 import upf.plan
 
 import generated.upf_pb2 as upf_pb2
-from converter import Converter, handles
+from problem_cache import BatchDomain, BatchInstance, ProblemDelta
+from converter import (
+    BOOL_VALUE,
+    INT_VALUE,
+    OBJECT_VALUE,
+    REAL_VALUE,
+    Converter,
+    handles,
+    value_kind,
+)
+
+# Protobuf parsers refuse messages nested more than 100 levels deep. Deeper
+# expressions are sent through the expression table of their scope, where
+# every entry is one level deep, even without `shared_expressions`.
+MAX_WIRE_DEPTH = 64
+
+
+def _untyped_payload(payload):
+    if payload is None:
+        return "none", "-"
+    elif isinstance(payload, bool):
+        return "bool", str(payload)
+    elif isinstance(payload, int):
+        return "int", str(payload)
+    elif isinstance(payload, numbers.Real):
+        return "real", str(Fraction(payload))
+    elif isinstance(payload, upf.model.Fluent):
+        return "fluent", payload.name()
+    elif isinstance(payload, upf.model.Object):
+        return "obj", payload.name()
+    elif isinstance(payload, upf.model.ActionParameter):
+        return "aparam", payload.name()
+    else:
+        return "str", str(payload)
 
 
 class ToProtobufConverter(Converter):
+    def __init__(
+        self,
+        shared_expressions=False,
+        intern_symbols=False,
+        packed_initial_state=False,
+        typed_payloads=False,
+    ):
+        # When `shared_expressions` is set, problems and actions are encoded
+        # as DAGs: every distinct expression is stored once in the expression
+        # table of its scope and referenced by index everywhere it is used.
+        self.shared_expressions = shared_expressions
+        self._table = None
+        # When `intern_symbols` is set, the names used in a problem or answer
+        # are stored once in its string table and referenced by index. The
+        # Rust server does not read string tables.
+        self.intern_symbols = intern_symbols
+        self._symbols = None
+        # When `packed_initial_state` is set, the initial state of problems is
+        # sent in the columnar `packed_initial_state` section.
+        self.packed_initial_state = packed_initial_state
+        # When `typed_payloads` is set, payloads are sent in their typed
+        # fields. Otherwise they are sent as `type` and `value` strings, the
+        # only form the Rust server reads.
+        self.typed_payloads = typed_payloads
+        # Identity-keyed memo of the expressions already encoded in the
+        # current session, see `session`.
+        self._memo = None
+        # Identity-keyed height of the expressions met in the current
+        # session, to find the ones too deep to be nested.
+        self._heights = None
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    @contextmanager
+    def session(self):
+        """Encode each distinct FNode only once until the session is closed."""
+        if self._memo is not None:
+            yield self
+            return
+        self._memo = {}
+        self._heights = {}
+        self.memo_hits = 0
+        self.memo_misses = 0
+        try:
+            yield self
+        finally:
+            self._memo = None
+            self._heights = None
+
+    @contextmanager
+    def _expression_table(self, table):
+        # The table is used for every expression if `shared_expressions` is
+        # set, and only for too deep ones otherwise.
+        outer = self._table
+        self._table = (table, {})
+        try:
+            yield
+        finally:
+            self._table = outer
+
+    @contextmanager
+    def _symbol_table(self, table):
+        if not self.intern_symbols or self._symbols is not None:
+            yield
+            return
+        # Memoized messages refer to the symbols of the table they were
+        # encoded with, so they cannot be reused with a new table.
+        memo = self._memo
+        if memo is not None:
+            self._memo = {}
+        self._symbols = (table, {})
+        try:
+            yield
+        finally:
+            self._symbols = None
+            self._memo = memo
+
+    def _intern(self, name):
+        table, index = self._symbols
+        i = index.get(name)
+        if i is None:
+            i = index[name] = len(table)
+            table.append(name)
+        return i
+
     @handles(upf.model.Fluent)
     def _convert_fluent(self, fluent):
         name = fluent.name()
         sig = [str(t) for t in fluent.signature()]
         valType = str(fluent.type())
+        if self._symbols is not None:
+            return upf_pb2.Fluent(
+                name_id=self._intern(name),
+                value_type_id=self._intern(valType),
+                signature_ids=[self._intern(s) for s in sig],
+            )
         return upf_pb2.Fluent(name=name, valueType=valType, signature=sig)
 
     @handles(upf.model.Object)
     def _convert_object(self, obj):
+        if self._symbols is not None:
+            return upf_pb2.Object(
+                name_id=self._intern(obj.name()),
+                type_id=self._intern(obj.type().name()),
+            )
         return upf_pb2.Object(name=obj.name(), type=obj.type().name())
 
     @handles(upf.model.fnode.FNode)
     def _convert_expression(self, exp):
-        payload = exp._content.payload
-        value = None
+        if self._table is not None and self.shared_expressions:
+            return upf_pb2.Expression(ref=self._share_expression(exp))
+        if self._height(exp) > MAX_WIRE_DEPTH:
+            if self._table is None:
+                raise ValueError(
+                    "Expression nested deeper than %d levels outside of a "
+                    "problem or action" % MAX_WIRE_DEPTH
+                )
+            return upf_pb2.Expression(ref=self._share_expression(exp))
+        msg = upf_pb2.Expression()
+        self._encode_expression(exp, msg)
+        return msg
+
+    def _height(self, exp):
+        heights = self._heights if self._heights is not None else {}
+        stack = [exp]
+        while stack:
+            e = stack[-1]
+            if id(e) in heights:
+                stack.pop()
+                continue
+            args = e._content.args
+            missing = [a for a in args if id(a) not in heights]
+            if missing:
+                stack.extend(missing)
+                continue
+            stack.pop()
+            height = 1 + max([heights[id(a)][1] for a in args], default=0)
+            heights[id(e)] = (e, height)
+        return heights[id(exp)][1]
+
+    def _share_expression(self, exp):
+        # Adds `exp` and its missing subexpressions to the current table in
+        # post-order, so that the arguments of an entry always refer to
+        # earlier entries, and returns the reference of `exp`.
+        table, index = self._table
+        done = index.get(id(exp))
+        if done is not None:
+            self.memo_hits += 1
+            return done[1]
+        stack = [(exp, False)]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            exp, expanded = pop()
+            if id(exp) in index:
+                continue
+            content = exp._content
+            if not expanded:
+                push((exp, True))
+                for a in content.args:
+                    if id(a) not in index:
+                        push((a, False))
+                continue
+            msg = table.add(type=content.node_type)
+            self._encode_payload(content.payload, msg.payload)
+            for a in content.args:
+                msg.args.add(ref=index[id(a)][1])
+            index[id(exp)] = (exp, len(table))
+            self.memo_misses += 1
+        return index[id(exp)][1]
+
+    def _encode_expression(self, exp, msg):
+        # Expressions are encoded with an explicit work stack instead of
+        # recursing through `convert`: each argument message is added in place
+        # to its parent, so deep formulas cost neither a dispatch nor a Python
+        # frame per node and cannot hit the recursion limit.
+        stack = [(exp, msg)]
+        push = stack.append
+        pop = stack.pop
+        encode_payload = self._encode_payload
+        memo = self._memo
+        while stack:
+            exp, msg = pop()
+            if memo is not None:
+                # FNodes are hash-consed, so a subexpression shared by several
+                # preconditions or effects is the very same object: copy the
+                # message encoded the first time it was met.
+                done = memo.get(id(exp))
+                if done is not None:
+                    msg.CopyFrom(done[1])
+                    self.memo_hits += 1
+                    continue
+                memo[id(exp)] = (exp, msg)
+                self.memo_misses += 1
+            content = exp._content
+            msg.type = content.node_type
+            encode_payload(content.payload, msg.payload)
+            args = msg.args
+            for a in content.args:
+                push((a, args.add()))
+
+    def _encode_payload(self, payload, msg):
+        if not self.typed_payloads:
+            msg.type, msg.value = _untyped_payload(payload)
+            return
         if payload is None:
-            p_type = "none"
-            value = "-"
+            msg.kind = upf_pb2.Payload.NONE
         elif isinstance(payload, bool):
-            p_type = "bool"
+            msg.kind = upf_pb2.Payload.BOOL
+            msg.bool_value = payload
         elif isinstance(payload, int):
-            p_type = "int"
-        elif isinstance(payload, float):
-            p_type = "real"
-        elif isinstance(payload, upf.model.Fluent):
-            p_type = "fluent"
-            value = payload.name()
-        elif isinstance(payload, upf.model.Object):
-            p_type = "obj"
-            value = payload.name()
-        elif isinstance(payload, upf.model.ActionParameter):
-            p_type = "aparam"
-            value = payload.name()
+            msg.kind = upf_pb2.Payload.INT
+            msg.int_value = payload
+        elif isinstance(payload, numbers.Real):
+            msg.kind = upf_pb2.Payload.REAL
+            value = Fraction(payload)
+            msg.real.numerator = value.numerator
+            msg.real.denominator = value.denominator
         else:
-            p_type = "str"
-        if value is None:
-            value = str(payload)
-        return upf_pb2.Expression(
-            type=exp._content.node_type,
-            args=[self.convert(a) for a in exp._content.args],
-            payload=upf_pb2.Payload(type=p_type, value=value),
-        )
+            if isinstance(payload, upf.model.Fluent):
+                msg.kind = upf_pb2.Payload.FLUENT
+                symbol = payload.name()
+            elif isinstance(payload, upf.model.Object):
+                msg.kind = upf_pb2.Payload.OBJECT
+                symbol = payload.name()
+            elif isinstance(payload, upf.model.ActionParameter):
+                msg.kind = upf_pb2.Payload.PARAMETER
+                symbol = payload.name()
+            else:
+                msg.kind = upf_pb2.Payload.STRING
+                symbol = str(payload)
+            if self._symbols is not None:
+                msg.symbol_id = self._intern(symbol)
+            else:
+                msg.symbol = symbol
 
     @handles(upf.model.Effect)
     def _convert_effect(self, effect):
@@ -71,46 +302,149 @@ class ToProtobufConverter(Converter):
 
     @handles(upf.model.InstantaneousAction)
     def _convert_instantaneous_action(self, a):
-        return upf_pb2.Action(
-            name=a.name,
-            parameters=[p.name() for p in a.parameters()],
-            parameterTypes=[p.type().name() for p in a.parameters()],
-            preconditions=[self.convert(p) for p in a.preconditions()],
-            effects=[self.convert(t) for t in a.effects()],
-        )
+        names = [p.name() for p in a.parameters()]
+        types = [p.type().name() for p in a.parameters()]
+        if self._symbols is not None:
+            msg = upf_pb2.Action(
+                name_id=self._intern(a.name),
+                parameter_ids=[self._intern(n) for n in names],
+                parameter_type_ids=[self._intern(t) for t in types],
+            )
+        else:
+            msg = upf_pb2.Action(name=a.name, parameters=names, parameterTypes=types)
+        with self._expression_table(msg.expressions):
+            msg.preconditions.extend([self.convert(p) for p in a.preconditions()])
+            msg.effects.extend([self.convert(t) for t in a.effects()])
+        return msg
 
     @handles(upf.model.Problem)
     def _convert_problem(self, p):
+        with self.session():
+            return self._encode_problem(p)
+
+    def _encode_problem(self, p, domain=None, state=True):
+        # With a `domain`, only the objects missing from it are sent, and no
+        # fluents nor actions. Without `state`, neither the initial state nor
+        # the goals are sent.
         objs = []
         for t in p.user_types():
             for o in p.objects(t):
                 objs.append(o)
+        fluents = p.fluents()
+        shared = []
+        if domain is not None:
+            fluents = domain.fluents()
+            for t in domain.user_types():
+                shared.extend(domain.objects(t))
+            known = {o.name() for o in shared}
+            objs = [o for o in objs if o.name() not in known]
 
         t = p.env.expression_manager.TRUE()
 
-        return upf_pb2.Problem(
-            name=p.name,
-            fluents=[self.convert(p.fluent(f.name())) for f in p.fluents()],
-            objects=[self.convert(o) for o in objs],
-            actions=[self.convert(p.action(a.name)) for a in p.actions()],
-            initialState=[
-                self.convert(upf.model.Effect(x, v, t))
-                for x, v in p.initial_values().items()
-            ],
-            goals=[self.convert(g) for g in p.goals()],
+        # Fluents carry their default value, so only the explicit initial
+        # values that differ from it are sent.
+        defaults = p.fluents_defaults()
+        values = [
+            (x, v)
+            for x, v in p.explicit_initial_values().items()
+            if defaults.get(x.fluent()) is not v
+        ]
+
+        msg = upf_pb2.Problem(name=p.name)
+        with self._symbol_table(msg.symbols):
+            if domain is None:
+                for f in p.fluents():
+                    f_msg = msg.fluents.add()
+                    f_msg.CopyFrom(self.convert(p.fluent(f.name())))
+                    if f in defaults:
+                        f_msg.default_value.CopyFrom(self.convert(defaults[f]))
+            msg.objects.extend([self.convert(o) for o in objs])
+            if domain is None:
+                msg.actions.extend(
+                    [self.convert(p.action(a.name)) for a in p.actions()]
+                )
+            if not state:
+                return msg
+            with self._expression_table(msg.expressions):
+                if self.packed_initial_state:
+                    self._encode_packed_initial_state(
+                        fluents, shared + objs, values, msg.packed_initial_state
+                    )
+                else:
+                    msg.initialState.extend(
+                        [self.convert(upf.model.Effect(x, v, t)) for x, v in values]
+                    )
+                msg.goals.extend([self.convert(g) for g in p.goals()])
+        return msg
+
+    def _encode_packed_initial_state(self, fluents, objects, values, msg):
+        fluent_ids = {f.name(): i for i, f in enumerate(fluents)}
+        object_ids = {o.name(): i for i, o in enumerate(objects)}
+        n = len(values)
+        ids = np.empty(n, dtype=np.uint32)
+        payloads = np.empty(n, dtype=object)
+        args = []
+        for i, (x, v) in enumerate(values):
+            content = x._content
+            ids[i] = fluent_ids[content.payload.name()]
+            args.extend([object_ids[a._content.payload.name()] for a in content.args])
+            payloads[i] = v._content.payload
+
+        # Split the values by the value type of their fluent.
+        kinds = np.array([value_kind(f.type()) for f in fluents], dtype=np.int8)
+        kinds = kinds[ids] if n else kinds[:0]
+        msg.fluent_ids.extend(ids.tolist())
+        msg.args.extend(args)
+        msg.bool_values.extend(payloads[kinds == BOOL_VALUE].tolist())
+        msg.int_values.extend(payloads[kinds == INT_VALUE].astype(np.int64).tolist())
+        reals = [Fraction(v) for v in payloads[kinds == REAL_VALUE]]
+        msg.real_numerators.extend([v.numerator for v in reals])
+        msg.real_denominators.extend([v.denominator for v in reals])
+        msg.object_values.extend(
+            [object_ids[o.name()] for o in payloads[kinds == OBJECT_VALUE]]
         )
 
+    @handles(ProblemDelta)
+    def _convert_problem_delta(self, delta):
+        msg = upf_pb2.ProblemDelta(hash=delta.hash)
+        with self.session(), self._symbol_table(msg.symbols):
+            msg.initialState.extend(
+                [
+                    upf_pb2.Assignment(x=self.convert(x), v=self.convert(v))
+                    for x, v in delta.initial_values.items()
+                ]
+            )
+            msg.goals.extend([self.convert(g) for g in delta.goals])
+        return msg
+
+    @handles(BatchDomain)
+    def _convert_batch_domain(self, d):
+        with self.session():
+            return self._encode_problem(d.problem, state=False)
+
+    @handles(BatchInstance)
+    def _convert_batch_instance(self, i):
+        with self.session():
+            problem = self._encode_problem(i.problem, i.domain)
+        return upf_pb2.ProblemInstance(id=i.id, problem=problem)
+
     @handles(upf.plan.ActionInstance)
     def _convert_action_instance(self, ai):
-        a_msg = self.convert(ai.action())
+        # Plans refer to the actions of the problem by name, the receiver
+        # already knows their definition.
         p_msg = [self.convert(p) for p in ai.actual_parameters()]
-        return upf_pb2.ActionInstance(action=a_msg, parameters=p_msg)
+        if self._symbols is not None:
+            return upf_pb2.ActionInstance(
+                action_name_id=self._intern(ai.action().name), parameters=p_msg
+            )
+        return upf_pb2.ActionInstance(action_name=ai.action().name, parameters=p_msg)
 
     @handles(upf.plan.SequentialPlan, type(None))
     def _convert_sequential_plan(self, p):
         if p is None:
             return upf_pb2.Answer(status=1, plan=[])
         else:
-            ai_msgs = [self.convert(ai) for ai in p.actions()]
-            r = upf_pb2.Answer(status=0, plan=upf_pb2.SequentialPlan(actions=ai_msgs))
+            r = upf_pb2.Answer(status=0)
+            with self.session(), self._symbol_table(r.symbols):
+                r.plan.actions.extend([self.convert(ai) for ai in p.actions()])
             return r
@@ -251,6 +251,7 @@ impl Into<Expression> for Expression_ {
             r#type: self.type_,
             args: self.args.into_iter().map(|x| x.into()).collect(),
             payload: self.payload.unwrap().into(),
+            ..Default::default()
         }
     }
 }
@@ -300,6 +301,7 @@ impl Into<Payload> for Payload_ {
         Payload {
             r#type: self.type_,
             value: self.value,
+            ..Default::default()
         }
     }
 }
@@ -385,6 +387,7 @@ impl Into<Action> for Action_ {
             parameter_types: self.parameter_types,
             preconditions: self.preconditions.into_iter().map(|x| x.into()).collect(),
             effects: self.effects.into_iter().map(|x| x.into()).collect(),
+            ..Default::default()
         }
     }
 }
@@ -438,6 +441,7 @@ impl Into<ActionInstance> for ActionInstance_ {
         ActionInstance {
             action: self.action.unwrap().into(),
             parameters: self.parameters.into_iter().map(|x| x.into()).collect(),
+            ..Default::default()
         }
     }
 }
@@ -519,6 +523,7 @@ impl Answer_ {
         Answer {
             status: self.status,
             plan: self.plan.clone().map(|x| x.into()),
+            ..Default::default()
         }
     }
 }
@@ -2,14 +2,19 @@
  *   Copyright (c) 2022
  *   All rights reserved.
  */
+use std::pin::Pin;
+
 use async_trait::async_trait;
-use tonic::{transport::Server, Request, Response, Status};
+use tonic::codegen::futures_core::Stream;
+use tonic::{transport::Server, Request, Response, Status, Streaming};
 
 mod serialize;
 use serialize::*;
 
 use upf::upf_server::{Upf, UpfServer};
-use upf::{Answer, Problem};
+use upf::{
+    Answer, BatchAnswer, BatchRequest, PlanRequest, PlanUpdate, Problem, ProblemDelta, ProblemHandle,
+};
 
 #[derive(Default)]
 pub struct UpfService {}
@@ -26,6 +31,40 @@ impl Upf for UpfService {
         let response = Response::new(answer);
         Ok(response)
     }
+
+    async fn register_problem(
+        &self,
+        _request: Request<Problem>,
+    ) -> Result<Response<ProblemHandle>, Status> {
+        Err(Status::unimplemented("registerProblem is not supported"))
+    }
+
+    async fn plan_delta(
+        &self,
+        _request: Request<ProblemDelta>,
+    ) -> Result<Response<Answer>, Status> {
+        Err(Status::unimplemented("planDelta is not supported"))
+    }
+
+    type PlanOneShotStream =
+        Pin<Box<dyn Stream<Item = Result<PlanUpdate, Status>> + Send + Sync + 'static>>;
+
+    async fn plan_one_shot(
+        &self,
+        _request: Request<PlanRequest>,
+    ) -> Result<Response<Self::PlanOneShotStream>, Status> {
+        Err(Status::unimplemented("planOneShot is not supported"))
+    }
+
+    type PlanBatchStream =
+        Pin<Box<dyn Stream<Item = Result<BatchAnswer, Status>> + Send + Sync + 'static>>;
+
+    async fn plan_batch(
+        &self,
+        _request: Request<Streaming<BatchRequest>>,
+    ) -> Result<Response<Self::PlanBatchStream>, Status> {
+        Err(Status::unimplemented("planBatch is not supported"))
+    }
 }
 
 #[tokio::main]